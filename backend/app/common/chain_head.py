@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+
+import websockets
+from eth_utils import to_hex
+
+from app.common.web3_client import get_w3
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Head:
+    """The newest block header seen."""
+
+    number: int
+    hash: str
+    timestamp: int
+    base_fee: int | None  # None on a pre-EIP-1559 chain
+    received_at: float
+
+
+class HeadWatcher:
+    """One app-wide view of the chain head.
+
+    `run` follows new blocks with `eth_subscribe("newHeads")` over
+    RPC_WS_URL, or by polling the latest block over HTTP when no WebSocket
+    URL is set or the subscription drops (it retries the WebSocket after
+    `ws_retry` seconds). Components read `head`/`latest()` instead of
+    fetching the latest block themselves and wait for the next block with
+    `next_head()`. If the cached head is older than `max_age` (watcher not
+    running or stalled), those fall back to fetching it directly.
+    """
+
+    def __init__(self, ws_url: str = "", poll_interval: float = 1.0, max_age: float = 5.0, ws_retry: float = 30.0):
+        self.ws_url = ws_url
+        self.poll_interval = poll_interval
+        self.max_age = max_age
+        self.ws_retry = ws_retry
+        self.head: Head | None = None
+        self.source = "none"  # "ws" | "http" | "none"
+        self._new_head = asyncio.Event()
+
+    def _update(self, header: dict) -> Head:
+        def as_int(value) -> int | None:
+            return int(value, 16) if isinstance(value, str) else value
+
+        number = as_int(header["number"])
+        current = self.head
+        if current is not None and number < current.number:
+            return current  # late or reorged-out header
+        block_hash = header["hash"]
+        head = Head(
+            number=number,
+            hash=block_hash if isinstance(block_hash, str) else to_hex(block_hash),
+            timestamp=as_int(header["timestamp"]),
+            base_fee=as_int(header.get("baseFeePerGas")),
+            received_at=time.time(),
+        )
+        self.head = head
+        if current is None or number > current.number:
+            # Wake everyone waiting for a new block, then re-arm
+            event, self._new_head = self._new_head, asyncio.Event()
+            event.set()
+        return head
+
+    def _fresh(self) -> Head | None:
+        head = self.head
+        if head is not None and time.time() - head.received_at < self.max_age:
+            return head
+        return None
+
+    async def fetch(self) -> Head:
+        """Read the latest block over HTTP and update the cached head."""
+        return self._update(await get_w3().eth.get_block("latest"))
+
+    async def latest(self) -> Head:
+        """The cached head, or a freshly fetched one if the cache is stale."""
+        return self._fresh() or await self.fetch()
+
+    async def next_head(self, after: int | None) -> Head:
+        """Wait for a head newer than block `after` (any head if None)."""
+        while True:
+            head = self._fresh()
+            if head is not None and (after is None or head.number > after):
+                return head
+            event = self._new_head
+            try:
+                await asyncio.wait_for(event.wait(), self.max_age)
+            except asyncio.TimeoutError:
+                # No new head from the watcher: check ourselves
+                head = await self.fetch()
+                if after is None or head.number > after:
+                    return head
+
+    async def run(self):
+        """Background task: keep `head` current."""
+        while True:
+            if self.ws_url:
+                try:
+                    await self._subscribe()
+                    reason = "closed"
+                except Exception as e:
+                    reason = f"error: {e}"
+                logger.warning(f"newHeads subscription {reason}; polling over HTTP for {self.ws_retry:.0f}s")
+                await self._poll(time.monotonic() + self.ws_retry)
+            else:
+                await self._poll()
+
+    async def _subscribe(self):
+        async with websockets.connect(self.ws_url) as ws:
+            await ws.send(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "eth_subscribe", "params": ["newHeads"]}))
+            reply = json.loads(await ws.recv())
+            if "error" in reply:
+                raise RuntimeError(reply["error"])
+            logger.info(f"Subscribed to newHeads at {self.ws_url}")
+            self.source = "ws"
+            async for message in ws:
+                params = json.loads(message).get("params")
+                if params is not None:
+                    self._update(params["result"])
+
+    async def _poll(self, until: float | None = None):
+        self.source = "http"
+        while until is None or time.monotonic() < until:
+            try:
+                await self.fetch()
+            except Exception as e:
+                logger.warning(f"Head poll failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    def snapshot(self) -> dict:
+        head = self.head
+        return {
+            "source": self.source,
+            "number": None if head is None else head.number,
+            "timestamp": None if head is None else head.timestamp,
+            "base_fee": None if head is None else head.base_fee,
+            "age": None if head is None else time.time() - head.received_at,
+        }
+
+
+# Global singleton
+head_watcher = HeadWatcher(
+    ws_url=settings.rpc_ws_url,
+    poll_interval=settings.head_poll_interval,
+    max_age=settings.head_max_age,
+    ws_retry=settings.head_ws_retry,
+)
@@ -1,16 +1,231 @@
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
 
 from web3 import AsyncWeb3
+from web3.contract.async_contract import AsyncContractFunction
+from web3.exceptions import ContractLogicError, Web3RPCError
+
+from app.common.chain_head import head_watcher
+from app.common.web3_client import get_account, get_w3
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_GAS_LIMIT = 3_000_000
+
+
+class _NoBaseFee(ValueError):
+    """eth_feeHistory answered without a base fee: the chain has no EIP-1559 pricing."""
+
+
+def _method_missing(e: Web3RPCError) -> bool:
+    """True if the node says it doesn't implement the method (vs. a transient failure)."""
+    error = (e.rpc_response or {}).get("error")
+    if isinstance(error, dict):
+        if error.get("code") == -32601:
+            return True
+        message = str(error.get("message", ""))
+    else:
+        message = e.message
+    return any(s in message.lower() for s in ("not found", "not supported", "unsupported", "does not exist"))
+
+
+@dataclass(frozen=True)
+class Fees:
+    """Fee fields for one transaction."""
+
+    max_fee: int  # maxFeePerGas, or gasPrice on a legacy (pre-EIP-1559) chain
+    priority_fee: int | None  # maxPriorityFeePerGas; None on a legacy chain
+
+    def tx_params(self) -> dict:
+        if self.priority_fee is None:
+            return {"gasPrice": self.max_fee}
+        return {"maxFeePerGas": self.max_fee, "maxPriorityFeePerGas": self.priority_fee}
+
+    def bumped(self, pct: float) -> "Fees":
+        """Fees for a same-nonce replacement: nodes require every fee field raised (>=10% in geth)."""
+        def bump(fee: int) -> int:
+            return fee * int(1000 + pct * 10) // 1000 + 1
+
+        return Fees(bump(self.max_fee), None if self.priority_fee is None else bump(self.priority_fee))
+
+    def at_least(self, other: "Fees") -> "Fees":
+        if self.priority_fee is None or other.priority_fee is None:
+            return Fees(max(self.max_fee, other.max_fee), None)
+        return Fees(max(self.max_fee, other.max_fee), max(self.priority_fee, other.priority_fee))
+
+
+@dataclass(frozen=True)
+class FeeQuote:
+    block_number: int
+    base_fee: int  # base fee of the next block (0 on a legacy chain)
+    fees: Fees
+    fetched_at: float
+
+
+class FeeOracle:
+    """EIP-1559 fees from `eth_feeHistory`, refreshed at most once per block.
+
+    maxPriorityFeePerGas is the median over the last `history_blocks` blocks
+    of the `priority_percentile`-th percentile tip; maxFeePerGas is
+    `base_fee_multiplier` x the next block's base fee plus that tip, which
+    survives several full blocks of base-fee growth. Chains without
+    `eth_feeHistory` or a base fee fall back to `eth_gasPrice` for good; a
+    transient `eth_feeHistory` error only for that quote. A quote is reused until the head
+    watcher sees a newer block (or for `max_age` seconds without one);
+    concurrent callers share one refresh.
+    """
+
+    def __init__(
+        self,
+        history_blocks: int = 10,
+        priority_percentile: float = 50.0,
+        base_fee_multiplier: float = 2.0,
+        max_age: float = 2.0,
+    ):
+        self.history_blocks = history_blocks
+        self.priority_percentile = priority_percentile
+        self.base_fee_multiplier = base_fee_multiplier
+        self.max_age = max_age
+        self.quote: FeeQuote | None = None
+        self.legacy: bool | None = None  # set once the chain is known not to support eth_feeHistory/base fee
+        self._refresh_lock = asyncio.Lock()
+
+    async def get_fees(self) -> Fees:
+        quote = self.quote
+        head = head_watcher.head
+        if (
+            quote is None
+            or (head is not None and head.number > quote.block_number)
+            or time.time() - quote.fetched_at >= self.max_age
+        ):
+            quote = await self.refresh()
+        return quote.fees
+
+    async def refresh(self) -> FeeQuote:
+        stale = self.quote
+        async with self._refresh_lock:
+            if self.quote is not stale:  # another caller refreshed while we waited
+                return self.quote
+            w3 = get_w3()
+            if not self.legacy:
+                try:
+                    self.quote = await self._from_fee_history(w3)
+                    self.legacy = False
+                    return self.quote
+                except (Web3RPCError, _NoBaseFee) as e:
+                    if self.legacy is False:
+                        raise
+                    if isinstance(e, _NoBaseFee) or _method_missing(e):
+                        # Not an EIP-1559 chain
+                        logger.warning(f"eth_feeHistory unusable ({e}); using legacy gas price")
+                        self.legacy = True
+                    else:
+                        # Undecided until eth_feeHistory answers; legacy price for now, retried next refresh
+                        logger.warning(f"eth_feeHistory failed ({e}); legacy gas price for this quote")
+            gas_price = await w3.eth.gas_price
+            self.quote = FeeQuote(await w3.eth.block_number, 0, Fees(gas_price, None), time.time())
+            return self.quote
+
+    async def _from_fee_history(self, w3: AsyncWeb3) -> FeeQuote:
+        history = await w3.eth.fee_history(self.history_blocks, "latest", [self.priority_percentile])
+        base_fees = history["baseFeePerGas"]
+        if not base_fees or not base_fees[-1]:
+            raise _NoBaseFee("no base fee")
+        newest_block = history["oldestBlock"] + len(history["reward"]) - 1
+        if self.quote is not None and self.quote.block_number == newest_block:
+            # Same block as the cached quote: fees can't have changed
+            return FeeQuote(newest_block, self.quote.base_fee, self.quote.fees, time.time())
+
+        tips = sorted(r[0] for r in history["reward"]) or [0]
+        priority_fee = tips[len(tips) // 2]
+        next_base_fee = base_fees[-1]  # entry after the newest block is the next one's base fee
+        max_fee = int(next_base_fee * self.base_fee_multiplier) + priority_fee
+        return FeeQuote(newest_block, next_base_fee, Fees(max_fee, priority_fee), time.time())
+
+
+class GasEstimator:
+    """`eth_estimateGas` results cached by call shape.
+
+    The shape is the contract, the function and the length of each list
+    argument (the batch size), or an explicit `shape` for calls whose cost
+    depends on state rather than arguments. Estimates get `margin_pct`
+    headroom and are re-estimated after `ttl` seconds.
+    """
+
+    def __init__(self, margin_pct: float = 20.0, ttl: float = 300.0):
+        self.margin_pct = margin_pct
+        self.ttl = ttl
+        self._cache: dict[tuple, tuple[int, float]] = {}  # key -> (gas limit, estimated at)
+
+    @staticmethod
+    def key(fn: AsyncContractFunction, shape=None) -> tuple:
+        if shape is None:
+            shape = tuple(len(a) if isinstance(a, (list, tuple)) else None for a in fn.args)
+        return fn.address, fn.abi_element_identifier, shape
+
+    async def estimate(self, fn: AsyncContractFunction, shape=None, sender: str | None = None) -> int:
+        """Gas limit for `fn` sent from `sender` (default: the primary operator).
+
+        Raises `ContractLogicError` if the call would revert.
+        """
+        key = self.key(fn, shape)
+        cached = self._cache.get(key)
+        if cached is not None and time.time() - cached[1] < self.ttl:
+            return cached[0]
+        try:
+            estimate = await fn.estimate_gas({"from": sender or get_account().address})
+        except ContractLogicError:
+            raise
+        except Exception as e:
+            logger.warning(f"Gas estimate for {fn.abi_element_identifier} failed ({e}); using {DEFAULT_GAS_LIMIT}")
+            return DEFAULT_GAS_LIMIT
+        gas = int(estimate * (1 + self.margin_pct / 100))
+        self._cache[key] = (gas, time.time())
+        return gas
+
+    def invalidate(self, fn: AsyncContractFunction, shape=None):
+        """Drop the cached estimate, e.g. after a transaction using it failed."""
+        self._cache.pop(self.key(fn, shape), None)
+
+    def snapshot(self) -> dict:
+        return {
+            identifier if all(n is None for n in shape) else f"{identifier} {list(shape)}": gas
+            for (_, identifier, shape), (gas, _) in self._cache.items()
+        }
+
+
+# Global singletons
+fee_oracle = FeeOracle(
+    history_blocks=settings.gas_fee_history_blocks,
+    priority_percentile=settings.gas_priority_percentile,
+    base_fee_multiplier=settings.gas_base_fee_multiplier,
+    max_age=settings.gas_fee_max_age,
+)
+gas_estimator = GasEstimator(margin_pct=settings.gas_estimate_margin_pct, ttl=settings.gas_estimate_ttl)
+
+
+async def get_fees() -> Fees:
+    """Current fees for a new transaction."""
+    return await fee_oracle.get_fees()
+
+
+async def estimate_gas(fn: AsyncContractFunction, shape=None, sender: str | None = None) -> int:
+    """Gas limit for `fn`, cached by call shape."""
+    return await gas_estimator.estimate(fn, shape, sender)
+
 
 async def get_gas_info(w3: AsyncWeb3) -> dict:
-    """Get current gas price and block info."""
-    gas_price = await w3.eth.gas_price
-    block = await w3.eth.get_block("latest")
+    """Get current fees and block info (block from the shared head, no extra RPC call)."""
+    await fee_oracle.get_fees()
+    quote = fee_oracle.quote
+    head = await head_watcher.latest()
     return {
-        "gas_price_gwei": float(w3.from_wei(gas_price, "gwei")),
-        "block_number": block["number"],
-        "block_timestamp": block["timestamp"],
+        "gas_price_gwei": float(w3.from_wei(quote.fees.max_fee, "gwei")),
+        "base_fee_gwei": float(w3.from_wei(quote.base_fee, "gwei")),
+        "priority_fee_gwei": None if quote.fees.priority_fee is None else float(w3.from_wei(quote.fees.priority_fee, "gwei")),
+        "block_number": head.number,
+        "block_timestamp": head.timestamp,
     }
@@ -0,0 +1,41 @@
+import importlib.util
+import logging
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Application-scoped client; opened/closed by the FastAPI lifespan
+_client: httpx.AsyncClient | None = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    http2 = settings.http_http2 and importlib.util.find_spec("h2") is not None
+    if settings.http_http2 and not http2:
+        logger.warning("HTTP/2 requested but h2 is not installed (pip install 'httpx[http2]'); using HTTP/1.1")
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(settings.http_timeout, connect=settings.http_connect_timeout),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The shared pooled client (created on first use outside the app lifespan, e.g. scripts)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,124 @@
+import logging
+
+from web3.contract import AsyncContract
+from web3.contract.async_contract import AsyncContractFunction
+
+from app.common.web3_client import RPCError, batch_call, batch_request, decode_call_result, get_w3
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# The parts of the Multicall3 ABI used here (same on the canonical deployment
+# and packages/oracle/src/Multicall3.sol)
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "tryBlockAndAggregate",
+        "stateMutability": "payable",
+        "inputs": [
+            {"name": "requireSuccess", "type": "bool"},
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            },
+        ],
+        "outputs": [
+            {"name": "blockNumber", "type": "uint256"},
+            {"name": "blockHash", "type": "bytes32"},
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            },
+        ],
+    },
+]
+
+_contract: AsyncContract | None = None
+_available: bool | None = None  # MULTICALL3_ADDRESS has code on the connected chain
+
+
+def _multicall3() -> AsyncContract:
+    global _contract
+    w3 = get_w3()
+    if _contract is None or _contract.w3 is not w3:
+        _contract = w3.eth.contract(address=w3.to_checksum_address(settings.multicall3_address), abi=MULTICALL3_ABI)
+    return _contract
+
+
+async def _has_multicall3() -> bool:
+    global _available
+    if _available is None:
+        # Only decided once the lookup succeeds: a transient RPC error raises and is retried next call
+        available = False
+        if settings.multicall3_address:
+            code = await get_w3().eth.get_code(_multicall3().address)
+            available = len(code) > 0
+        _available = available
+        if not available:
+            logger.warning(
+                f"No Multicall3 at {settings.multicall3_address or '(unset)'}; "
+                "multicall() falls back to JSON-RPC batches"
+            )
+    return _available
+
+
+async def _aggregate(chunks: list[list[AsyncContractFunction]], block: int | str) -> tuple[int, list]:
+    # One tryBlockAndAggregate eth_call per chunk; several are sent as one JSON-RPC
+    # batch, a single one as a plain request (see batch_request)
+    multicall3 = _multicall3()
+    block = hex(block) if isinstance(block, int) else block
+    aggregates = [
+        multicall3.functions.tryBlockAndAggregate(False, [(c.address, c._encode_transaction_data()) for c in chunk])
+        for chunk in chunks
+    ]
+    raw = await batch_request([
+        ("eth_call", [{"to": multicall3.address, "data": fn._encode_transaction_data()}, block])
+        for fn in aggregates
+    ])
+
+    block_number, results = None, []
+    for fn, chunk, data in zip(aggregates, chunks, raw):
+        decoded = data if isinstance(data, BaseException) else decode_call_result(fn, data)
+        if isinstance(decoded, BaseException):
+            raise decoded
+        block_number, _, returned = decoded
+        results.extend(
+            decode_call_result(c, ret) if success else RPCError({"message": "execution reverted", "data": ret.hex()})
+            for c, (success, ret) in zip(chunk, returned)
+        )
+    return block_number, results
+
+
+async def multicall(calls: list[AsyncContractFunction], block_number: int | None = None) -> tuple[int, list]:
+    """Evaluate many view calls in one `eth_call` through Multicall3, all at one block.
+
+    Returns (block number, results). Results are decoded like `fn.call()`, in
+    call order, with an exception in place of a call that reverted. Pass the
+    returned block number back in to pin follow-up reads to the same state.
+    Lists longer than MULTICALL_CHUNK_SIZE are split into several calls at
+    that block, sent as one JSON-RPC batch; a single call goes out as a plain
+    `eth_call`. Without a Multicall3 deployment this falls back to
+    `batch_call` pinned to the block.
+    """
+    if not await _has_multicall3():
+        if block_number is None:
+            block_number = await get_w3().eth.block_number
+        return block_number, await batch_call(calls, block_number)
+
+    size = settings.multicall_chunk_size
+    chunks = [calls[i:i + size] for i in range(0, len(calls), size)] or [[]]
+    if block_number is not None or len(chunks) == 1:
+        return await _aggregate(chunks, "latest" if block_number is None else block_number)
+
+    # The first chunk fixes the block; the rest are pinned to it
+    block_number, results = await _aggregate(chunks[:1], "latest")
+    _, rest = await _aggregate(chunks[1:], block_number)
+    return block_number, results + rest
@@ -0,0 +1,262 @@
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+
+import httpx
+from web3._utils.batching import sort_batch_response_by_response_ids
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from app.common.http import get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Sent to the sticky primary only: the mempool/nonce/receipt view must come
+# from the node the transactions were sent to
+STICKY_METHODS = frozenset({
+    "eth_sendRawTransaction",
+    "eth_sendTransaction",
+    "eth_getTransactionCount",
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+})
+
+MIN_HEDGE_SAMPLES = 10  # latency samples before a node's p95 is trusted for hedging
+
+
+class BatchRejected(Exception):
+    """An endpoint refused a JSON-RPC batch with an HTTP client error; send the requests one by one."""
+
+
+class RPCNode:
+    """One RPC endpoint with its recent latency and health."""
+
+    def __init__(self, url: str, window: int = 200):
+        self.url = url
+        self.latencies: deque[float] = deque(maxlen=window)  # seconds, successful requests
+        self.sampled_at = 0.0  # monotonic time of the newest latency sample
+        self.requests = 0
+        self.errors = 0
+        self.hedges_won = 0
+        self.consecutive_failures = 0
+        self.down_until = 0.0
+
+    def record(self, latency: float | None, max_failures: int, cooldown: float):
+        """Record a request: its latency, or None if the node failed to answer."""
+        self.requests += 1
+        if latency is not None:
+            self.latencies.append(latency)
+            self.sampled_at = time.monotonic()
+            self.consecutive_failures = 0
+            return
+        self.errors += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= max_failures:
+            self.down_until = time.monotonic() + cooldown
+            logger.warning(f"RPC {self.url} down for {cooldown:.0f}s after {self.consecutive_failures} failures")
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+    def percentile(self, q: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+    def snapshot(self) -> dict:
+        p50, p95 = self.percentile(50), self.percentile(95)
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "requests": self.requests,
+            "errors": self.errors,
+            "hedges_won": self.hedges_won,
+            "p50_ms": None if p50 is None else round(p50 * 1000, 1),
+            "p95_ms": None if p95 is None else round(p95 * 1000, 1),
+            "mean_ms": round(statistics.fmean(self.latencies) * 1000, 1) if self.latencies else None,
+        }
+
+
+class RPCPoolProvider(AsyncJSONBaseProvider):
+    """JSON-RPC over several endpoints on the app-wide pooled httpx client.
+
+    Reads go to the fastest healthy node (lowest median latency; nodes
+    without samples are tried first). A node that has had no traffic for
+    `resample_after` seconds drops its old samples and so gets tried again:
+    otherwise one slow answer would rank it last for good, since only the
+    first-ranked node sees new reads. If it hasn't answered after its own
+    p95 latency, the same request is sent to the next-fastest node and the
+    first answer wins. A node that fails (transport error or HTTP error
+    status) is skipped over immediately; after `max_failures` failures in a
+    row it is left out for `cooldown` seconds. Writes and mempool/nonce
+    reads stick to one primary, the first configured node, until it fails.
+    JSON-RPC errors (reverts etc.) are answers, not node failures.
+    """
+
+    _headers = {"Content-Type": "application/json"}
+
+    def __init__(
+        self,
+        endpoint_uris: list[str],
+        hedge: bool = True,
+        hedge_percentile: float = 95.0,
+        hedge_min_delay: float = 0.02,
+        max_failures: int = 3,
+        cooldown: float = 30.0,
+        latency_window: int = 200,
+        resample_after: float = 60.0,
+        **kwargs,
+    ):
+        self.nodes = [RPCNode(url, latency_window) for url in endpoint_uris]
+        self.endpoint_uri = endpoint_uris[0]
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.resample_after = resample_after
+        self.hedged = 0
+        self._primary = self.nodes[0]
+        super().__init__(**kwargs)
+
+    def __str__(self) -> str:
+        return f"RPC connection {', '.join(node.url for node in self.nodes)}"
+
+    async def _post(self, node: RPCNode, data: bytes) -> bytes:
+        start = time.perf_counter()
+        try:
+            resp = await get_http_client().post(node.url, content=data, headers=self._headers)
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if data.startswith(b"[") and e.response.is_client_error and status != 429:
+                # The node answered but refuses batches (disabled, too large): not a node failure
+                node.record(time.perf_counter() - start, self.max_failures, self.cooldown)
+                raise BatchRejected(f"RPC {node.url} rejected a batch request (HTTP {status})") from e
+            node.record(None, self.max_failures, self.cooldown)
+            raise
+        except httpx.HTTPError:
+            node.record(None, self.max_failures, self.cooldown)
+            raise
+        node.record(time.perf_counter() - start, self.max_failures, self.cooldown)
+        return resp.content
+
+    def _ranked(self) -> list[RPCNode]:
+        healthy = [node for node in self.nodes if node.healthy]
+        if not healthy:
+            # Everything is down: try the one that went down first
+            return sorted(self.nodes, key=lambda node: node.down_until)
+        stale = time.monotonic() - self.resample_after
+        for node in healthy:
+            if node.latencies and node.sampled_at < stale:
+                node.latencies.clear()
+        return sorted(healthy, key=lambda node: node.percentile(50) or 0.0)
+
+    async def _read(self, data: bytes) -> bytes:
+        nodes = self._ranked()
+        first, rest = nodes[0], nodes[1:]
+        started = time.perf_counter()
+        primary = asyncio.create_task(self._post(first, data))
+
+        p95 = first.percentile(self.hedge_percentile)
+        if self.hedge and rest and p95 is not None and len(first.latencies) >= MIN_HEDGE_SAMPLES:
+            done, _ = await asyncio.wait({primary}, timeout=max(p95, self.hedge_min_delay))
+            if not done:
+                self.hedged += 1
+                second, rest = rest[0], rest[1:]
+                hedge = (asyncio.create_task(self._post(second, data)), second, time.perf_counter())
+                try:
+                    return await self._race((primary, first, started), hedge)
+                except httpx.HTTPError:
+                    if not rest:
+                        raise
+                return await self._failover(rest, data)
+
+        try:
+            return await primary
+        except httpx.HTTPError as e:
+            if not rest:
+                raise
+            logger.warning(f"RPC {first.url} failed ({e!r}), failing over")
+        return await self._failover(rest, data)
+
+    async def _race(self, primary: tuple, hedge: tuple) -> bytes:
+        """First successful answer of two (task, node, start time) entries.
+
+        The loser is cancelled, and the time it had taken so far is recorded
+        as its latency: a lower bound, but it keeps a node that turned slow
+        from holding on to its old, fast median.
+        """
+        entries = {primary[0]: primary, hedge[0]: hedge}
+        pending = set(entries)
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge[0]:
+                            hedge[1].hedges_won += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            now = time.perf_counter()
+            for task in pending:
+                task.cancel()
+                _, node, started = entries[task]
+                node.record(now - started, self.max_failures, self.cooldown)
+
+    async def _failover(self, nodes: list[RPCNode], data: bytes) -> bytes:
+        for node in nodes[:-1]:
+            try:
+                return await self._post(node, data)
+            except httpx.HTTPError as e:
+                logger.warning(f"RPC {node.url} failed ({e!r}), failing over")
+        return await self._post(nodes[-1], data)
+
+    async def _write(self, data: bytes) -> bytes:
+        """Send to the sticky primary; if it fails, the next healthy node becomes primary."""
+        node = self._primary
+        if not node.healthy:
+            node = self._promote(node)
+        try:
+            return await self._post(node, data)
+        except httpx.HTTPError as e:
+            promoted = self._promote(node)
+            if promoted is node:
+                raise  # nowhere else to send it
+            logger.warning(f"RPC primary {node.url} failed ({e!r}), retrying on {promoted.url}")
+            return await self._post(promoted, data)
+
+    def _promote(self, failed: RPCNode) -> RPCNode:
+        candidates = [node for node in self.nodes if node is not failed and node.healthy] or [failed]
+        if candidates[0] is not self._primary:
+            self._primary = candidates[0]
+            logger.warning(f"RPC primary is now {self._primary.url}")
+        return self._primary
+
+    async def make_request(self, method: RPCEndpoint, params) -> RPCResponse:
+        data = self.encode_rpc_request(method, params)
+        raw = await (self._write(data) if method in STICKY_METHODS else self._read(data))
+        return self.decode_rpc_response(raw)
+
+    async def make_batch_request(self, requests: list[tuple[RPCEndpoint, object]]) -> list[RPCResponse] | RPCResponse:
+        data = self.encode_batch_rpc_request(requests)
+        sticky = any(method in STICKY_METHODS for method, _ in requests)
+        response = self.decode_rpc_response(await (self._write(data) if sticky else self._read(data)))
+        if not isinstance(response, list):
+            # RPC errors return a single error object for the whole batch
+            return response
+        return sort_batch_response_by_response_ids(response)
+
+    def snapshot(self) -> dict:
+        return {
+            "primary": self._primary.url,
+            "hedged": self.hedged,
+            "nodes": [node.snapshot() for node in self.nodes],
+        }
@@ -0,0 +1,427 @@
+import asyncio
+import heapq
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+
+from web3.contract.async_contract import AsyncContractFunction
+from web3.exceptions import TransactionNotFound
+
+from app.common.chain_head import head_watcher
+from app.common.gas_manager import Fees, estimate_gas, gas_estimator, get_fees
+from app.common.web3_client import batch_request, get_operator_accounts, get_w3
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+FILLER_GAS_LIMIT = 21_000
+RECEIPT_GRACE_BLOCKS = 5  # blocks a mined nonce may lack a receipt before its versions are looked up
+
+
+@dataclass(eq=False)
+class PendingTx:
+    """A broadcast transaction holding a nonce until one of its versions is mined."""
+
+    nonce: int
+    sender: str  # operator address (the lane) holding the nonce
+    label: str
+    fn: AsyncContractFunction | None  # None for a gap-filling self-transfer
+    gas: int
+    fees: Fees
+    raw: bytes  # newest signed version, kept for rebroadcast
+    sent_at: float  # first broadcast
+    last_sent_at: float
+    versions: list[str] = field(default_factory=list)  # tx hashes, oldest first
+    shape: object = None  # gas estimate cache shape, see GasEstimator
+    missing_receipt: int = 0  # checks in a row where the nonce was mined but no receipt was found
+    mined_hash: str | None = None
+    status: int | None = None  # receipt status once mined
+    done: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+    async def wait(self) -> str:
+        """Wait until mined; returns the hash that landed, raises if it reverted."""
+        return await asyncio.shield(self.done)
+
+
+@dataclass
+class TxMetrics:
+    submitted: int = 0
+    replaced: int = 0
+    rebroadcast: int = 0
+    gaps_filled: int = 0
+    confirmed: int = 0
+    reverted: int = 0
+    send_failed: int = 0
+    last_confirm_latency: float = 0.0  # first broadcast -> receipt seen (seconds)
+
+
+class TxLane:
+    """One operator key's nonce sequence and receipt tracking.
+
+    `submit` reserves a nonce, signs and broadcasts, and returns a `PendingTx`
+    right away, so any number of transactions can be in flight. `run` is the
+    one receipt tracker for all of them: once per new block it reads the
+    mined nonce and fetches the receipts of everything below it in a single
+    batch. It also repairs the sequence: a nonce reserved but never
+    broadcast is reused by the next submit or filled with a no-op
+    self-transfer, a transaction the node dropped is rebroadcast, and one
+    stuck at the head for `stuck_after` seconds is replaced with higher fees.
+    Fees and gas limits come from `gas_manager`.
+    """
+
+    def __init__(
+        self,
+        account,
+        replace_bump_pct: float = 12.5,
+        max_replacements: int = 5,
+        stuck_after: float = 30.0,
+    ):
+        self.account = account
+        self.replace_bump_pct = replace_bump_pct
+        self.max_replacements = max_replacements
+        self.stuck_after = stuck_after
+        self.pending: dict[int, PendingTx] = {}
+        self.metrics = TxMetrics()
+        self._next_nonce: int | None = None
+        self._free: list[int] = []  # reserved nonces that were never broadcast (min-heap)
+        self._reserved: set[int] = set()  # reserved, broadcast in progress
+        self._nonce_lock = asyncio.Lock()
+        self._replace_lock = asyncio.Lock()
+        self._has_pending = asyncio.Event()
+        self._last_block: int | None = None
+
+    async def _reserve(self) -> int:
+        async with self._nonce_lock:
+            if self._free:
+                nonce = heapq.heappop(self._free)
+            else:
+                if self._next_nonce is None:
+                    self._next_nonce = await get_w3().eth.get_transaction_count(self.account.address, "pending")
+                nonce = self._next_nonce
+                self._next_nonce += 1
+            self._reserved.add(nonce)
+            return nonce
+
+    async def _release(self, nonce: int, error: Exception):
+        self._reserved.discard(nonce)
+        if "nonce too low" not in str(error).lower():
+            heapq.heappush(self._free, nonce)
+            return
+
+        # Consumed elsewhere (another process on this key): resync so the next submits don't fail too
+        try:
+            chain_next = await get_w3().eth.get_transaction_count(self.account.address, "pending")
+        except Exception as e:
+            logger.warning(f"Nonce resync for {self.account.address[:10]} failed: {e}")
+            return
+        async with self._nonce_lock:
+            self._free = [n for n in self._free if n >= chain_next]
+            heapq.heapify(self._free)
+            if self._next_nonce is None or self._next_nonce < chain_next:
+                self._next_nonce = chain_next
+        logger.warning(f"Nonce too low at {self.account.address[:10]} nonce {nonce}; resynced to {chain_next}")
+
+    async def _sign(self, fn: AsyncContractFunction | None, nonce: int, gas: int, fees: Fees) -> bytes:
+        account = self.account
+        tx = {
+            "from": account.address,
+            "nonce": nonce,
+            "gas": gas,
+            **fees.tx_params(),
+            "chainId": settings.chain_id,
+        }
+        if fn is None:
+            tx = {**tx, "to": account.address, "value": 0}
+        else:
+            tx = await fn.build_transaction(tx)
+        return account.sign_transaction(tx).raw_transaction
+
+    async def _broadcast(self, raw: bytes) -> str:
+        w3 = get_w3()
+        return w3.to_hex(await w3.eth.send_raw_transaction(raw))
+
+    async def submit(
+        self,
+        fn: AsyncContractFunction | None,
+        gas: int | None = None,
+        label: str = "",
+        shape=None,
+        nonce: int | None = None,
+    ) -> PendingTx:
+        """Sign and broadcast `fn` at the next free nonce; returns without waiting for a receipt.
+
+        The gas limit is estimated (cached by `shape`, see `GasEstimator`) unless given.
+        """
+        if gas is None:
+            gas = FILLER_GAS_LIMIT if fn is None else await estimate_gas(fn, shape, self.account.address)
+        if nonce is None:
+            nonce = await self._reserve()
+        try:
+            fees = await get_fees()
+            raw = await self._sign(fn, nonce, gas, fees)
+            tx_hash = await self._broadcast(raw)
+        except Exception as e:
+            self.metrics.send_failed += 1
+            await self._release(nonce, e)
+            raise
+
+        now = time.time()
+        tx = PendingTx(nonce, self.account.address, label, fn, gas, fees, raw, now, now, [tx_hash], shape)
+        tx.done.add_done_callback(lambda f: f.cancelled() or f.exception())  # nobody has to await it
+        self.pending[nonce] = tx
+        self._reserved.discard(nonce)
+        self.metrics.submitted += 1
+        self._has_pending.set()
+        return tx
+
+    async def replace(self, tx: PendingTx, fn: AsyncContractFunction | None = None) -> str:
+        """Re-sign `tx` at its nonce with bumped fees (and `fn` instead, if given).
+
+        Raises if the node rejects it, most often because a version was mined meanwhile.
+        """
+        async with self._replace_lock:
+            if tx.done.done():
+                raise RuntimeError(f"nonce {tx.nonce} already mined")
+            fn = tx.fn if fn is None else fn
+            fees = tx.fees.bumped(self.replace_bump_pct).at_least(await get_fees())
+            raw = await self._sign(fn, tx.nonce, tx.gas, fees)
+            tx_hash = await self._broadcast(raw)
+
+            tx.fn, tx.fees, tx.raw, tx.last_sent_at = fn, fees, raw, time.time()
+            tx.versions.append(tx_hash)
+            self.metrics.replaced += 1
+            logger.info(f"TX replaced at {self.account.address[:10]} nonce {tx.nonce} (max fee {fees.max_fee}): {tx_hash}")
+            return tx_hash
+
+    # ─── Receipt tracker ───
+
+    async def run(self):
+        """Background task: on each new block, resolve mined transactions and repair the nonce sequence."""
+        while True:
+            await self._has_pending.wait()
+            try:
+                head = await head_watcher.next_head(self._last_block)
+                self._last_block = head.number
+                await self._check()
+            except Exception as e:
+                logger.warning(f"TX tracker check failed: {e}")
+
+    async def _check(self):
+        w3 = get_w3()
+        mined_nonce = await w3.eth.get_transaction_count(self.account.address, "latest")
+
+        # Everything below the mined nonce has a receipt for one of its versions,
+        # though the node may not have indexed it yet
+        mined = [tx for nonce, tx in self.pending.items() if nonce < mined_nonce]
+        if mined:
+            hashes = [(tx, h) for tx in mined for h in tx.versions]
+            receipts = await batch_request([("eth_getTransactionReceipt", [h]) for _, h in hashes])
+            found: dict[int, dict] = {}
+            for (tx, _), receipt in zip(hashes, receipts):
+                if receipt is not None and not isinstance(receipt, BaseException):
+                    found[tx.nonce] = receipt
+            overdue = []
+            for tx in mined:
+                if tx.nonce in found:
+                    self._resolve(tx, found[tx.nonce])
+                else:
+                    tx.missing_receipt += 1
+                    if tx.missing_receipt >= RECEIPT_GRACE_BLOCKS:
+                        overdue.append(tx)
+            if overdue:
+                await self._resolve_unknown(overdue)
+
+        async with self._nonce_lock:
+            self._free = [n for n in self._free if n >= mined_nonce]
+            heapq.heapify(self._free)
+            if self._next_nonce is not None and self._next_nonce < mined_nonce:
+                self._next_nonce = mined_nonce
+
+        await self._repair_head(mined_nonce)
+        if not self.pending:
+            self._has_pending.clear()
+
+    async def _resolve_unknown(self, txs: list[PendingTx]):
+        """Resolve mined nonces whose receipts never showed up and that the node doesn't know any version of."""
+        hashes = [(tx, h) for tx in txs for h in tx.versions]
+        found = await batch_request([("eth_getTransactionByHash", [h]) for _, h in hashes])
+        known = {tx.nonce for (tx, _), result in zip(hashes, found) if result is not None}
+        for tx in txs:
+            if tx.nonce not in known:
+                # Consumed by a transaction we didn't send (another process on this key)
+                self._resolve(tx, None)
+
+    def _resolve(self, tx: PendingTx, receipt: dict | None):
+        self.pending.pop(tx.nonce, None)
+        if tx.done.done():
+            return
+        m = self.metrics
+        if receipt is None:
+            tx.done.set_exception(RuntimeError(f"nonce {tx.nonce} was consumed by an unknown transaction"))
+            return
+        tx.mined_hash = receipt["transactionHash"]
+        tx.status = int(receipt["status"], 16)
+        if tx.status != 1:
+            m.reverted += 1
+            logger.error(f"TX failed: {tx.mined_hash}")
+            if tx.fn is not None:
+                gas_estimator.invalidate(tx.fn, tx.shape)  # maybe out of gas: re-estimate next time
+            tx.done.set_exception(RuntimeError(f"Transaction failed: {tx.mined_hash}"))
+            return
+        m.confirmed += 1
+        m.last_confirm_latency = time.time() - tx.sent_at
+        tx.done.set_result(tx.mined_hash)
+
+    async def _repair_head(self, mined_nonce: int):
+        """Unblock the nonce the chain is waiting for, if it's ours and not moving."""
+        head = self.pending.get(mined_nonce)
+        if head is None:
+            above = any(n > mined_nonce for n in self.pending)
+            if above and mined_nonce not in self._reserved:
+                # Gap: reserved but never broadcast, and nothing else will use it soon
+                await self._fill_gap(mined_nonce)
+            return
+
+        if time.time() - head.last_sent_at < self.stuck_after:
+            return
+        try:
+            await get_w3().eth.get_transaction(head.versions[-1])
+            dropped = False
+        except TransactionNotFound:
+            dropped = True
+        if dropped:
+            # Dropped from the mempool: the same signed tx is still valid
+            try:
+                await self._broadcast(head.raw)
+                head.last_sent_at = time.time()
+                self.metrics.rebroadcast += 1
+                logger.warning(f"TX rebroadcast at nonce {head.nonce}: {head.versions[-1]}")
+            except Exception as e:
+                logger.warning(f"TX rebroadcast at nonce {head.nonce} failed: {e}")
+        elif len(head.versions) <= self.max_replacements:
+            try:
+                await self.replace(head)
+            except Exception as e:
+                logger.warning(f"Stuck TX replacement at nonce {head.nonce} failed: {e}")
+
+    async def _fill_gap(self, nonce: int):
+        async with self._nonce_lock:
+            if nonce in self._free:
+                self._free.remove(nonce)
+                heapq.heapify(self._free)
+            self._reserved.add(nonce)
+        try:
+            await self.submit(None, label="gap-fill", nonce=nonce)
+            self.metrics.gaps_filled += 1
+            logger.warning(f"Filled nonce gap at {nonce}")
+        except Exception as e:
+            logger.warning(f"Nonce gap fill at {nonce} failed: {e}")
+
+    @property
+    def load(self) -> int:
+        """Transactions holding a nonce of this lane."""
+        return len(self.pending) + len(self._reserved)
+
+    def snapshot(self) -> dict:
+        now = time.time()
+        return {
+            "address": self.account.address,
+            **asdict(self.metrics),
+            "next_nonce": self._next_nonce,
+            "free_nonces": sorted(self._free),
+            "pending": [
+                {
+                    "nonce": tx.nonce,
+                    "label": tx.label,
+                    "max_fee": tx.fees.max_fee,
+                    "age": now - tx.sent_at,
+                    "versions": len(tx.versions),
+                }
+                for tx in sorted(self.pending.values(), key=lambda tx: tx.nonce)
+            ],
+        }
+
+
+class TxManager:
+    """Operator transactions over a pool of keys, one `TxLane` per key.
+
+    A submit's `label` is its job type ("oracle", "settlement", "relayer").
+    Jobs pinned in `routes` (job -> lane index) always use that lane, so an
+    oracle push never waits on a nonce behind a big settlement batch; other
+    jobs go to the lane with the fewest transactions in flight.
+    """
+
+    def __init__(self, routes: dict[str, int] | None = None, **lane_options):
+        self.routes = routes or {}
+        self.lane_options = lane_options
+        self._lanes: list[TxLane] | None = None
+        self._by_sender: dict[str, TxLane] = {}
+
+    @property
+    def lanes(self) -> list[TxLane]:
+        if self._lanes is None:
+            self._lanes = [TxLane(account, **self.lane_options) for account in get_operator_accounts()]
+            self._by_sender = {lane.account.address: lane for lane in self._lanes}
+            for job, index in list(self.routes.items()):
+                if not 0 <= index < len(self._lanes):
+                    logger.warning(f"OPERATOR_LANES: no lane {index} for {job!r} ({len(self._lanes)} keys)")
+                    del self.routes[job]
+        return self._lanes
+
+    def lane_for(self, label: str) -> TxLane:
+        lanes = self.lanes
+        if label in self.routes:
+            return lanes[self.routes[label]]
+        # Least loaded among lanes no job is pinned to, if there are any
+        pinned = set(self.routes.values())
+        free = [lane for i, lane in enumerate(lanes) if i not in pinned] or lanes
+        return min(free, key=lambda lane: lane.load)
+
+    async def submit(
+        self,
+        fn: AsyncContractFunction,
+        gas: int | None = None,
+        label: str = "",
+        shape=None,
+    ) -> PendingTx:
+        """Broadcast `fn` on the lane for `label`; see `TxLane.submit`."""
+        return await self.lane_for(label).submit(fn, gas, label, shape)
+
+    async def send(self, fn: AsyncContractFunction, gas: int | None = None, label: str = "", shape=None) -> str:
+        """Submit and wait for the receipt. Returns the mined tx hash; raises if it reverted."""
+        tx = await self.submit(fn, gas, label, shape)
+        tx_hash = await tx.wait()
+        logger.info(f"TX success: {tx_hash}")
+        return tx_hash
+
+    async def replace(self, tx: PendingTx, fn: AsyncContractFunction | None = None) -> str:
+        """Replace `tx` on its own lane; see `TxLane.replace`."""
+        return await self._by_sender[tx.sender].replace(tx, fn)
+
+    async def run(self):
+        """Background task: the receipt tracker of every lane."""
+        await asyncio.gather(*(lane.run() for lane in self.lanes))
+
+    def snapshot(self) -> dict:
+        return {
+            "routes": self.routes,
+            "lanes": [lane.snapshot() for lane in self.lanes],
+            "gas_estimates": gas_estimator.snapshot(),
+        }
+
+
+def _parse_routes(spec: str) -> dict[str, int]:
+    routes = {}
+    for item in filter(None, (i.strip() for i in spec.split(","))):
+        job, _, index = item.partition("=")
+        routes[job.strip()] = int(index)
+    return routes
+
+
+# Global singleton
+tx_manager = TxManager(
+    routes=_parse_routes(settings.operator_lanes),
+    replace_bump_pct=settings.tx_replace_bump_pct,
+    max_replacements=settings.tx_max_replacements,
+    stuck_after=settings.tx_stuck_after,
+)
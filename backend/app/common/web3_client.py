@@ -1,40 +1,124 @@
 import asyncio
+import functools
 import json
 import logging
 from pathlib import Path
 
 from eth_account import Account
-from web3 import AsyncHTTPProvider, AsyncWeb3
+from eth_utils.abi import get_abi_output_types
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.contract import AsyncContract
+from web3.contract.async_contract import AsyncContractFunction
+from web3.contract.utils import format_contract_call_return_data_curried
 from web3.middleware import ExtraDataToPOAMiddleware
+from web3.types import BlockIdentifier
 
+from app.common.rpc_pool import BatchRejected, RPCPoolProvider
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Nonce lock for safe concurrent transactions
-_nonce_lock = asyncio.Lock()
-_current_nonce: int | None = None
 
+# App-wide client: one provider over the RPC endpoint pool, middleware injected once
+_w3: AsyncWeb3 | None = None
+_chain_id: int | None = None
 
-def get_w3() -> AsyncWeb3:
-    w3 = AsyncWeb3(AsyncHTTPProvider(settings.rpc_url))
-    w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-    return w3
+
+def rpc_urls() -> list[str]:
+    """RPC_URL (the write primary) followed by the extra RPC_URLS, deduplicated."""
+    urls = [settings.rpc_url, *settings.rpc_urls.split(",")]
+    return list(dict.fromkeys(filter(None, (url.strip() for url in urls))))
 
 
+def get_w3() -> AsyncWeb3:
+    global _w3
+    if _w3 is None:
+        _w3 = AsyncWeb3(RPCPoolProvider(
+            rpc_urls(),
+            hedge=settings.rpc_hedge,
+            hedge_percentile=settings.rpc_hedge_percentile,
+            hedge_min_delay=settings.rpc_hedge_min_delay_ms / 1000,
+            max_failures=settings.rpc_max_failures,
+            cooldown=settings.rpc_cooldown,
+            resample_after=settings.rpc_resample_after,
+        ))
+        _w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+    return _w3
+
+
+async def get_chain_id() -> int:
+    """Chain ID reported by the node, fetched once."""
+    global _chain_id
+    if _chain_id is None:
+        _chain_id = await get_w3().eth.chain_id
+    return _chain_id
+
+
+async def init_w3():
+    """Warm the RPC connection at startup and check the node's chain against CHAIN_ID."""
+    chain_id = await get_chain_id()
+    if chain_id != settings.chain_id:
+        logger.error(f"RPC chain ID {chain_id} != CHAIN_ID {settings.chain_id}; transactions will be rejected")
+    else:
+        logger.info(f"Connected to {', '.join(rpc_urls())} (chain {chain_id})")
+
+
+def close_w3():
+    """Drop the client; its connections belong to the shared pool (`close_http_client`)."""
+    global _w3, _chain_id
+    _w3 = None
+    _chain_id = None
+    _contracts.clear()
+
+
+@functools.cache
 def get_account():
     return Account.from_key(settings.operator_private_key)
 
 
+@functools.cache
+def get_operator_accounts() -> tuple:
+    """The operator key pool: OPERATOR_PRIVATE_KEY first, then OPERATOR_PRIVATE_KEYS (deduplicated)."""
+    keys = [settings.operator_private_key, *settings.operator_private_keys.split(",")]
+    accounts = {}
+    for key in filter(None, (k.strip() for k in keys)):
+        account = Account.from_key(key)
+        accounts.setdefault(account.address, account)
+    return tuple(accounts.values())
+
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+# Compact {"<package>/<Contract>": abi} bundle written by scripts/extract-abi.sh
+_ABI_BUNDLES = [Path("/app/abi/bundle.json"), _BACKEND_DIR / "abi" / "bundle.json"]
+
+
+@functools.cache
+def _abi_bundle() -> dict[str, list]:
+    for path in _ABI_BUNDLES:
+        if path.exists():
+            with open(path) as f:
+                return json.load(f)
+    return {}
+
+
+@functools.cache
 def load_abi(contract_name: str, package: str = "oracle") -> list:
-    """Load ABI from Foundry artifacts. Searches multiple paths for Docker/local compatibility."""
+    """Load an ABI once: from the compact bundle if present, else from Foundry artifacts.
+
+    Searches multiple paths for Docker/local compatibility.
+    """
+    bundled = _abi_bundle().get(f"{package}/{contract_name}")
+    if bundled is not None:
+        return bundled
+
     candidates = [
         # Docker: mounted ABI directory
         Path("/app/abi") / package / f"{contract_name}.json",
         # Local: relative to backend/
-        Path(__file__).resolve().parent.parent.parent / "abi" / package / f"{contract_name}.json",
+        _BACKEND_DIR / "abi" / package / f"{contract_name}.json",
         # Local: Foundry output in monorepo
-        Path(__file__).resolve().parent.parent.parent.parent / "packages" / package / "out" / f"{contract_name}.sol" / f"{contract_name}.json",
+        _BACKEND_DIR.parent / "packages" / package / "out" / f"{contract_name}.sol" / f"{contract_name}.json",
     ]
     for artifact_path in candidates:
         if artifact_path.exists():
@@ -44,34 +128,101 @@ def load_abi(contract_name: str, package: str = "oracle") -> list:
     raise FileNotFoundError(f"ABI not found for {contract_name}. Searched: {[str(p) for p in candidates]}")
 
 
-async def send_tx(w3: AsyncWeb3, contract_fn, account) -> str:
-    """Build, sign, and send a transaction with nonce management."""
-    global _current_nonce
-
-    async with _nonce_lock:
-        if _current_nonce is None:
-            _current_nonce = await w3.eth.get_transaction_count(account.address)
-
-        nonce = _current_nonce
-        _current_nonce += 1
-
-    gas_price = await w3.eth.gas_price
-
-    tx = await contract_fn.build_transaction({
-        "from": account.address,
-        "nonce": nonce,
-        "gas": 3_000_000,
-        "gasPrice": gas_price,
-        "chainId": settings.chain_id,
-    })
-
-    signed = account.sign_transaction(tx)
-    tx_hash = await w3.eth.send_raw_transaction(signed.raw_transaction)
-    receipt = await w3.eth.wait_for_transaction_receipt(tx_hash)
-
-    if receipt["status"] != 1:
-        logger.error(f"TX failed: {tx_hash.hex()}")
-        raise RuntimeError(f"Transaction failed: {tx_hash.hex()}")
-
-    logger.info(f"TX success: {tx_hash.hex()}")
-    return tx_hash.hex()
+# (package, name, address) -> contract bound to the app-wide client
+_contracts: dict[tuple[str, str, str], AsyncContract] = {}
+
+
+def get_contract(contract_name: str, package: str, address: str) -> AsyncContract:
+    """Cached contract object for `contract_name` deployed at `address`."""
+    key = (package, contract_name, address)
+    contract = _contracts.get(key)
+    if contract is None:
+        w3 = get_w3()
+        contract = w3.eth.contract(address=w3.to_checksum_address(address), abi=load_abi(contract_name, package))
+        _contracts[key] = contract
+    return contract
+
+
+# ─── JSON-RPC batching ───
+
+
+class RPCError(RuntimeError):
+    """An error object returned for one request of a JSON-RPC batch."""
+
+    def __init__(self, error: dict):
+        self.code = error.get("code")
+        self.data = error.get("data")
+        super().__init__(error.get("message", str(error)))
+
+
+async def _send_chunk(requests: list[tuple[str, list]]) -> list:
+    provider = get_w3().provider
+    if len(requests) == 1:
+        # Nothing to batch: a plain request also works where batches are refused
+        responses = await asyncio.gather(provider.make_request(*requests[0]), return_exceptions=True)
+    else:
+        try:
+            responses = await provider.make_batch_request(requests)
+        except BatchRejected:
+            responses = None
+        except Exception as e:
+            logger.warning(f"RPC batch failed ({e!r}); sending its {len(requests)} requests individually")
+            responses = None
+
+    if not isinstance(responses, list):
+        # The node refused the batch as a whole (e.g. batching disabled or too
+        # large; an error object or HTTP 4xx) or it failed in transit: fall
+        # back to individual requests so items still fail alone
+        responses = await asyncio.gather(
+            *(provider.make_request(method, params) for method, params in requests),
+            return_exceptions=True,
+        )
+
+    results = []
+    for response in responses:
+        if isinstance(response, BaseException):
+            results.append(response)
+        elif "error" in response:
+            results.append(RPCError(response["error"]))
+        else:
+            results.append(response.get("result"))
+    return results
+
+
+async def batch_request(requests: list[tuple[str, list]], chunk_size: int | None = None) -> list:
+    """Send raw (method, params) requests as JSON-RPC batches; results in request order.
+
+    Requests are split into chunks of `chunk_size` (RPC_BATCH_SIZE) sent
+    concurrently; a lone request is sent as a plain request. A failed item
+    is returned as its exception instead of raising, so one bad request
+    doesn't sink the others.
+    """
+    chunk_size = chunk_size or settings.rpc_batch_size
+    chunks = [requests[i:i + chunk_size] for i in range(0, len(requests), chunk_size)]
+    results = await asyncio.gather(*(_send_chunk(chunk) for chunk in chunks))
+    return [item for chunk in results for item in chunk]
+
+
+async def batch_call(calls: list[AsyncContractFunction], block_identifier: BlockIdentifier = "latest") -> list:
+    """`fn.call()` for many contract calls in ~one round trip (see `batch_request`).
+
+    Returns decoded values in call order, with an exception in place of any
+    call that reverted or failed.
+    """
+    block = hex(block_identifier) if isinstance(block_identifier, int) else block_identifier
+    requests = [
+        ("eth_call", [{"to": fn.address, "data": fn._encode_transaction_data()}, block])
+        for fn in calls
+    ]
+    raw = await batch_request(requests)
+    return [data if isinstance(data, BaseException) else decode_call_result(fn, data) for fn, data in zip(calls, raw)]
+
+
+def decode_call_result(fn: AsyncContractFunction, data: bytes | str):
+    """Decode raw eth_call output for `fn` like `fn.call()` would; the exception if it can't."""
+    try:
+        return format_contract_call_return_data_curried(
+            get_w3(), False, fn.abi, fn.abi_element_identifier, (), get_abi_output_types(fn.abi), HexBytes(data)
+        )
+    except Exception as e:
+        return e
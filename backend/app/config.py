@@ -4,10 +4,43 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     # RPC
     rpc_url: str = "https://rpc.cc3-testnet.creditcoin.network"
+    rpc_urls: str = ""  # extra comma-separated endpoints for reads/failover; RPC_URL stays the write primary
+    rpc_hedge: bool = True  # resend a read to the next-fastest endpoint when it's slower than usual
+    rpc_hedge_percentile: float = 95.0  # "slower than usual" = past this latency percentile of the endpoint
+    rpc_hedge_min_delay_ms: float = 20.0
+    rpc_max_failures: int = 3  # failures in a row before an endpoint is benched
+    rpc_cooldown: float = 30.0  # seconds a benched endpoint is skipped
+    rpc_resample_after: float = 60.0  # seconds without traffic before an endpoint's latency samples are dropped and it's retried
+    rpc_ws_url: str = ""  # eth_subscribe("newHeads") endpoint; empty = poll the latest block over HTTP
     chain_id: int = 102031
 
+    # Shared HTTP client (RPC + price REST sources)
+    http_http2: bool = True  # needs h2 (httpx[http2]); falls back to HTTP/1.1
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20  # idle connections kept open for reuse
+    http_keepalive_expiry: float = 30.0  # seconds an idle connection is kept
+    http_timeout: float = 10.0  # read/write/pool timeout (seconds)
+    http_connect_timeout: float = 5.0
+    rpc_batch_size: int = 50  # eth_calls per JSON-RPC batch request
+    multicall3_address: str = "0xcA11bde05977b3631167028862bE2a173976CA11"  # canonical; empty = JSON-RPC batches
+    multicall_chunk_size: int = 100  # calls per Multicall3 eth_call
+    head_poll_interval: float = 1.0  # seconds between latest-block polls without a newHeads subscription
+    head_max_age: float = 5.0  # seconds before the cached head is considered stale and fetched directly
+    head_ws_retry: float = 30.0  # seconds of HTTP polling before retrying a dropped newHeads subscription
+
     # Operator wallet
     operator_private_key: str = ""
+    operator_private_keys: str = ""  # extra comma-separated keys, one nonce lane each
+    operator_lanes: str = ""  # pin jobs to lanes, e.g. "oracle=0,settlement=1"; others: least-loaded lane
+    tx_replace_bump_pct: float = 12.5  # gas price bump when replacing a pending tx (nodes require >=10%)
+    tx_max_replacements: int = 5  # fee bumps of a stuck tx before leaving it alone
+    tx_stuck_after: float = 30.0  # seconds at the head of the nonce queue before rebroadcast/replacement
+    gas_fee_history_blocks: int = 10  # blocks of eth_feeHistory behind each fee quote
+    gas_priority_percentile: float = 50.0  # tip percentile within each block; median across blocks
+    gas_base_fee_multiplier: float = 2.0  # maxFeePerGas = this x next base fee + tip
+    gas_fee_max_age: float = 2.0  # seconds a fee quote is reused when no new head is known
+    gas_estimate_margin_pct: float = 20.0  # headroom on eth_estimateGas results
+    gas_estimate_ttl: float = 300.0  # seconds before a cached gas estimate is re-estimated
 
     # Contract addresses
     oracle_btc_address: str = ""
@@ -21,8 +54,31 @@ class Settings(BaseSettings):
     port: int = 8000
 
     # Oracle
-    oracle_push_interval: int = 10  # seconds
+    oracle_push_interval: float = 1.0  # push-policy evaluation period when no price updates arrive
+    oracle_deviation_bps: float = 10.0  # push when price moved this much since the last push
+    oracle_heartbeat: float = 60.0  # push at least this often (seconds)
+    oracle_round_push_lead: float = 15.0  # force a push this long before a round locks/closes
+    oracle_max_replacements: int = 10  # replacements per nonce before waiting for it to be mined
     price_source: str = "binance"  # binance | coingecko
+    coingecko_min_interval: float = 15.0  # seconds between CoinGecko fallback requests (free tier)
+    oracle_venues: str = "binance,coinbase,kraken,okx"  # comma-separated; also: coingecko
+    oracle_aggregation: str = "median"  # median | trimmed_mean
+    oracle_quote_max_age: float = 10.0  # seconds before a venue quote is stale
+    oracle_max_deviation_bps: float = 50.0  # reject venues this far from the median
+    oracle_min_venues: int = 1  # fresh, agreeing venues required to publish
+
+    # Price cache
+    price_symbols: str = "btc"  # comma-separated underlyings, e.g. "btc,eth"; each gets its own shard
+    price_cache_max_ticks: int = 2_097_152  # raw trades per symbol (~48 MB): ~1 day of BTCUSDT at typical rates, hours at peak
+    price_rollup_max_bars: int = 20_160  # finished bars kept per resolution (14 days of 1m)
+    price_log_dir: str = ""  # durable tick log directory; empty disables persistence
+    price_log_segment_records: int = 1_048_576  # ticks per segment file (24 MB)
+    price_log_retention_hours: int = 48  # raw trades on disk; rollups persist separately
+    price_rollup_snapshot_interval: int = 60  # seconds between rollup snapshots in the log directory
+    trade_flush_interval_ms: int = 250  # batch Binance trades into the cache
+    binance_max_backlog: int = 100_000  # undecoded frames held before the oldest are dropped
+    binance_late_ms: int = 2000  # trades older than this when decoded count as late
+    price_ws_min_interval_ms: int = 100  # max WS broadcast rate per client (10/s)
 
     # Options
     round_duration: int = 300  # 5 minutes
@@ -5,10 +5,16 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.common.chain_head import head_watcher
+from app.common.http import close_http_client, get_http_client
+from app.common.tx_manager import tx_manager
+from app.common.web3_client import close_w3, init_w3, rpc_urls
 from app.config import settings
 from app.oracle.service import start_oracle_service
+from app.oracle.sources import binance_ws_feed
 from app.options.relayer import relayer_flush_loop
 from app.options.settlement import settlement_loop
+from app.price.registry import price_registry, rollup_snapshot_loop, trade_ingest_loop
 from app.price.websocket import price_broadcast_loop, price_ws_handler
 
 # Configure logging
@@ -24,7 +30,39 @@ async def lifespan(app: FastAPI):
     """Manage background tasks lifecycle."""
     tasks: list[asyncio.Task] = []
 
+    # One pooled HTTP client for RPC and price REST calls
+    get_http_client()
+    try:
+        await init_w3()
+    except Exception as e:
+        logger.warning(f"RPC not reachable at startup ({', '.join(rpc_urls())}): {e}")
+
+    # Warm-restart price history from the durable tick log
+    if settings.price_log_dir:
+        restored = price_registry.attach_logs(
+            settings.price_log_dir,
+            segment_records=settings.price_log_segment_records,
+            retention_sec=settings.price_log_retention_hours * 3600,
+        )
+        logger.info(f"Price cache restored ticks from {settings.price_log_dir}: {restored}")
+        tasks.append(asyncio.create_task(rollup_snapshot_loop()))
+
+    # Full-rate trade feed into the price cache (also drives the oracle price)
+    if settings.price_source == "binance":
+        tasks.append(asyncio.create_task(
+            binance_ws_feed(price_registry.symbols, on_trades=price_registry.submit_trades)
+        ))
+        tasks.append(asyncio.create_task(trade_ingest_loop()))
+        logger.info("Binance trade feed started")
+
+    # One chain-head follower (newHeads over WS, else HTTP polling) for every component
+    tasks.append(asyncio.create_task(head_watcher.run()))
+
     # Start background services if configured
+    if settings.operator_private_key:
+        # One receipt tracker for every operator transaction
+        tasks.append(asyncio.create_task(tx_manager.run()))
+
     if settings.operator_private_key and settings.oracle_btc_address:
         tasks.append(asyncio.create_task(start_oracle_service()))
         logger.info("Oracle service started")
@@ -47,6 +85,9 @@ async def lifespan(app: FastAPI):
     for task in tasks:
         task.cancel()
     await asyncio.gather(*tasks, return_exceptions=True)
+    price_registry.close_logs()
+    close_w3()
+    await close_http_client()
     logger.info("All background tasks stopped")
 
 
@@ -68,10 +109,12 @@ app.add_middleware(
 
 # Import and include routers
 from app.options.router import router as options_router
+from app.oracle.router import router as oracle_router
 from app.price.router import router as price_router
 
 app.include_router(price_router)
 app.include_router(options_router)
+app.include_router(oracle_router)
 
 
 # WebSocket endpoint
@@ -93,13 +136,17 @@ async def root():
         "version": "0.1.0",
         "endpoints": {
             "health": "/health",
-            "price_current": "/api/price/btc/current",
-            "price_history": "/api/price/btc/history",
-            "price_ohlcv": "/api/price/btc/ohlcv",
+            "price_symbols": price_registry.symbols,
+            "price_current": "/api/price/{symbol}/current",
+            "price_history": "/api/price/{symbol}/history",
+            "price_ohlcv": "/api/price/{symbol}/ohlcv",
+            "price_stats": "/api/price/{symbol}/stats",
+            "price_export": "/api/price/{symbol}/export",
             "price_ws": "/ws/price",
             "options_order": "/api/options/order",
             "options_rounds": "/api/options/rounds",
             "options_history": "/api/options/history",
             "options_balance": "/api/options/balance",
+            "oracle_status": "/api/oracle/status",
         },
     }
@@ -2,7 +2,8 @@ import asyncio
 import logging
 from collections import deque
 
-from app.common.web3_client import get_account, get_w3, load_abi, send_tx
+from app.common.tx_manager import tx_manager
+from app.common.web3_client import get_contract
 from app.config import settings
 from app.options.eip712 import verify_order_signature
 from app.options.schemas import SignedOrder
@@ -76,13 +77,7 @@ async def flush_matched_orders():
     if not batch:
         return
 
-    w3 = get_w3()
-    account = get_account()
-    abi = load_abi("OptionsRelayer", "options")
-    contract = w3.eth.contract(
-        address=w3.to_checksum_address(settings.options_relayer_address),
-        abi=abi,
-    )
+    contract = get_contract("OptionsRelayer", "options", settings.options_relayer_address)
 
     # Build arrays for submitSignedOrders
     over_orders = []
@@ -110,7 +105,7 @@ async def flush_matched_orders():
 
     try:
         fn = contract.functions.submitSignedOrders(over_orders, under_orders)
-        tx_hash = await send_tx(w3, fn, account)
+        tx_hash = await tx_manager.send(fn, label="relayer")
         logger.info(f"Flushed {len(batch)} matched pairs (tx: {tx_hash})")
     except Exception as e:
         logger.error(f"Failed to flush matched orders: {e}")
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Query
 
-from app.common.web3_client import get_w3, load_abi
+from app.common.multicall import multicall
+from app.common.web3_client import get_contract, get_w3
 from app.config import settings
 from app.options.relayer import add_order
 from app.options.schemas import BalanceInfo, OrderSubmission, RoundInfo
@@ -18,37 +19,34 @@ async def submit_order(submission: OrderSubmission):
 @router.get("/rounds")
 async def get_rounds(limit: int = Query(10, ge=1, le=100)):
     """Get recent rounds."""
-    w3 = get_w3()
-    abi = load_abi("SnowballOptions", "options")
-    contract = w3.eth.contract(
-        address=w3.to_checksum_address(settings.snowball_options_address),
-        abi=abi,
-    )
+    contract = get_contract("SnowballOptions", "options", settings.snowball_options_address)
 
-    current_id = await contract.functions.currentRoundId().call()
+    # All reads pinned to the block the round counter was read at
+    block, (current_id,) = await multicall([contract.functions.currentRoundId()])
+    if isinstance(current_id, Exception):
+        raise current_id
     if current_id == 0:
         return {"rounds": []}
 
     rounds = []
     start = max(1, current_id - limit + 1)
-
-    for rid in range(start, current_id + 1):
-        try:
-            r = await contract.functions.getRound(rid).call()
-            rounds.append(RoundInfo(
-                round_id=r[0],
-                lock_price=str(r[1]),
-                close_price=str(r[2]),
-                lock_timestamp=r[3],
-                close_timestamp=r[4],
-                duration=r[5],
-                status=r[6],
-                total_over=str(r[7]),
-                total_under=str(r[8]),
-                order_count=r[9],
-            ))
-        except Exception:
-            pass
+    _, results = await multicall([contract.functions.getRound(rid) for rid in range(start, current_id + 1)], block)
+
+    for r in results:
+        if isinstance(r, Exception):
+            continue
+        rounds.append(RoundInfo(
+            round_id=r[0],
+            lock_price=str(r[1]),
+            close_price=str(r[2]),
+            lock_timestamp=r[3],
+            close_timestamp=r[4],
+            duration=r[5],
+            status=r[6],
+            total_over=str(r[7]),
+            total_under=str(r[8]),
+            order_count=r[9],
+        ))
 
     return {"rounds": [r.model_dump() for r in rounds]}
 
@@ -56,38 +54,39 @@ async def get_rounds(limit: int = Query(10, ge=1, le=100)):
 @router.get("/history")
 async def get_history(address: str = Query(..., description="User address")):
     """Get user's order history (reads from recent rounds)."""
-    w3 = get_w3()
-    abi = load_abi("SnowballOptions", "options")
-    contract = w3.eth.contract(
-        address=w3.to_checksum_address(settings.snowball_options_address),
-        abi=abi,
-    )
+    contract = get_contract("SnowballOptions", "options", settings.snowball_options_address)
 
-    current_id = await contract.functions.currentRoundId().call()
+    block, (current_id,) = await multicall([contract.functions.currentRoundId()])
+    if isinstance(current_id, Exception):
+        raise current_id
     orders = []
 
-    # Check last 20 rounds
-    start = max(1, current_id - 20)
-    for rid in range(start, current_id + 1):
-        try:
-            round_data = await contract.functions.getRound(rid).call()
-            order_count = round_data[9]
-            for oid in range(order_count):
-                order = await contract.functions.getOrder(rid, oid).call()
-                # order: (overUser, underUser, amount, settled)
-                user_lower = address.lower()
-                if order[0].lower() == user_lower or order[1].lower() == user_lower:
-                    orders.append({
-                        "round_id": rid,
-                        "order_id": oid,
-                        "over_user": order[0],
-                        "under_user": order[1],
-                        "amount": str(order[2]),
-                        "settled": order[3],
-                        "user_direction": "over" if order[0].lower() == user_lower else "under",
-                    })
-        except Exception:
-            pass
+    # Check last 20 rounds: one multicall for the rounds, one for all their orders, same block
+    round_ids = list(range(max(1, current_id - 20), current_id + 1))
+    _, round_results = await multicall([contract.functions.getRound(rid) for rid in round_ids], block)
+    order_keys = [
+        (rid, oid)
+        for rid, round_data in zip(round_ids, round_results)
+        if not isinstance(round_data, Exception)
+        for oid in range(round_data[9])
+    ]
+    _, order_results = await multicall([contract.functions.getOrder(rid, oid) for rid, oid in order_keys], block)
+
+    user_lower = address.lower()
+    for (rid, oid), order in zip(order_keys, order_results):
+        if isinstance(order, Exception):
+            continue
+        # order: (overUser, underUser, amount, settled)
+        if order[0].lower() == user_lower or order[1].lower() == user_lower:
+            orders.append({
+                "round_id": rid,
+                "order_id": oid,
+                "over_user": order[0],
+                "under_user": order[1],
+                "amount": str(order[2]),
+                "settled": order[3],
+                "user_direction": "over" if order[0].lower() == user_lower else "under",
+            })
 
     return {"address": address, "orders": orders}
 
@@ -96,14 +95,13 @@ async def get_history(address: str = Query(..., description="User address")):
 async def get_balance(address: str = Query(..., description="User address")):
     """Get user's ClearingHouse balance and escrow."""
     w3 = get_w3()
-    abi = load_abi("OptionsClearingHouse", "options")
-    contract = w3.eth.contract(
-        address=w3.to_checksum_address(settings.clearing_house_address),
-        abi=abi,
-    )
-
-    balance = await contract.functions.balanceOf(w3.to_checksum_address(address)).call()
-    escrow = await contract.functions.escrowOf(w3.to_checksum_address(address)).call()
+    contract = get_contract("OptionsClearingHouse", "options", settings.clearing_house_address)
+
+    user = w3.to_checksum_address(address)
+    _, (balance, escrow) = await multicall([contract.functions.balanceOf(user), contract.functions.escrowOf(user)])
+    for result in (balance, escrow):
+        if isinstance(result, Exception):
+            raise result
 
     return BalanceInfo(
         address=address,
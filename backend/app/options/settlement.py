@@ -1,62 +1,129 @@
 import asyncio
 import logging
 
-from app.common.web3_client import get_account, get_w3, load_abi, send_tx
+from app.common.chain_head import head_watcher
+from app.common.multicall import multicall
+from app.common.tx_manager import PendingTx, tx_manager
+from app.common.web3_client import get_contract
 from app.config import settings
+from app.oracle.policy import push_policy
+from app.price.bus import Subscription, price_bus
 
 logger = logging.getLogger(__name__)
 
+# (round_id, timestamp) pairs a fresh oracle push was already requested for
+_push_requested: set[tuple[int, int]] = set()
+
+
+def _request_round_push(round_id: int, lock_timestamp: int, close_timestamp: int, now: int):
+    """Ask the oracle loop for an immediate push when a round is about to lock or close."""
+    _push_requested.difference_update([key for key in _push_requested if key[1] < now])
+    for ts in (lock_timestamp, close_timestamp):
+        if 0 <= ts - now <= settings.oracle_round_push_lead and (round_id, ts) not in _push_requested:
+            _push_requested.add((round_id, ts))
+            push_policy.request_push(f"round {round_id} at {ts}")
+
+
+async def _wait_next_check(sub: Subscription, deadline: float | None) -> bool:
+    """Sleep for the poll interval, or less once a price update reaches `deadline`.
+
+    BTC updates carry exchange time, so a round whose lock/close time has just
+    passed is handled on the first price after it instead of on the next poll.
+    Returns True if woken early by the deadline.
+    """
+    loop = asyncio.get_running_loop()
+    until = loop.time() + settings.settlement_poll_interval
+    while (remaining := until - loop.time()) > 0:
+        try:
+            update = await asyncio.wait_for(sub.get(), remaining)
+        except asyncio.TimeoutError:
+            return False
+        if deadline is not None and update.timestamp >= deadline:
+            return True
+    return False
+
 
 async def settlement_loop():
     """Background task: check for expired rounds and settle them."""
     logger.info(f"Settlement loop started (poll_interval={settings.settlement_poll_interval}s)")
 
-    while True:
-        try:
-            await _check_and_settle()
-        except Exception as e:
-            logger.error(f"Settlement error: {e}")
-        await asyncio.sleep(settings.settlement_poll_interval)
+    sub = price_bus.subscribe(maxsize=1, symbols={"btc"})
+    woken_for: int | None = None
+    try:
+        while True:
+            deadline = None
+            try:
+                deadline = await _check_and_settle()
+            except Exception as e:
+                logger.error(f"Settlement error: {e}")
+            # Wake early at most once per deadline (block time may lag exchange time)
+            if deadline == woken_for:
+                deadline = None
+            if await _wait_next_check(sub, deadline):
+                woken_for = deadline
+    finally:
+        sub.close()
 
 
-async def _check_and_settle():
-    w3 = get_w3()
-    account = get_account()
-    abi = load_abi("SnowballOptions", "options")
-    contract = w3.eth.contract(
-        address=w3.to_checksum_address(settings.snowball_options_address),
-        abi=abi,
-    )
+async def _check_and_settle() -> int | None:
+    """Execute/settle due rounds. Returns the next lock/close time of an open round, if any."""
+    contract = get_contract("SnowballOptions", "options", settings.snowball_options_address)
 
-    current_round_id = await contract.functions.currentRoundId().call()
+    # Everything is read at the cached head, whose timestamp is "now" on-chain
+    head = await head_watcher.latest()
+    _, (current_round_id,) = await multicall([contract.functions.currentRoundId()], head.number)
+    if isinstance(current_round_id, Exception):
+        raise current_round_id
     if current_round_id == 0:
-        return
+        return None
+
+    next_deadline: int | None = None
 
-    # Check current and previous rounds
-    for round_id in range(max(1, current_round_id - 5), current_round_id + 1):
+    # Check current and previous rounds (one multicall)
+    round_ids = list(range(max(1, current_round_id - 5), current_round_id + 1))
+    _, rounds = await multicall([contract.functions.getRound(round_id) for round_id in round_ids], head.number)
+    now = head.timestamp
+    submitted: list[tuple[int, str, PendingTx]] = []
+
+    for round_id, round_data in zip(round_ids, rounds):
         try:
-            round_data = await contract.functions.getRound(round_id).call()
+            if isinstance(round_data, Exception):
+                raise round_data
             # round_data: (roundId, lockPrice, closePrice, lockTimestamp, closeTimestamp, duration, status, totalOver, totalUnder, orderCount)
             status = round_data[6]
+            lock_timestamp = round_data[3]
             close_timestamp = round_data[4]
             order_count = round_data[9]
 
-            block = await w3.eth.get_block("latest")
-            now = block["timestamp"]
+            if status == 0:
+                _request_round_push(round_id, lock_timestamp, close_timestamp, now)
+                for ts in (lock_timestamp, close_timestamp):
+                    if ts > now and (next_deadline is None or ts < next_deadline):
+                        next_deadline = ts
 
             # Status 0 = Open, needs execution if expired
             if status == 0 and now >= close_timestamp and order_count > 0:
                 logger.info(f"Executing round {round_id}...")
                 fn = contract.functions.executeRound(round_id)
-                await send_tx(w3, fn, account)
-                logger.info(f"Round {round_id} executed")
+                submitted.append((round_id, "executed", await tx_manager.submit(fn, label="settlement")))
 
             # Status 1 = Locked, needs settlement
             elif status == 1 and order_count > 0:
                 logger.info(f"Settling round {round_id} ({order_count} orders)...")
                 fn = contract.functions.settleOrders(round_id, settings.batch_size)
-                await send_tx(w3, fn, account)
-                logger.info(f"Round {round_id} settled batch")
+                # Gas scales with the orders settled, not with the arguments
+                tx = await tx_manager.submit(fn, label="settlement", shape=(min(order_count, settings.batch_size),))
+                submitted.append((round_id, "settled batch", tx))
 
         except Exception as e:
             logger.error(f"Error processing round {round_id}: {e}")
+
+    # All rounds' transactions are in flight at once; wait for them together
+    results = await asyncio.gather(*(tx.wait() for _, _, tx in submitted), return_exceptions=True)
+    for (round_id, action, _), result in zip(submitted, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error processing round {round_id}: {result}")
+        else:
+            logger.info(f"Round {round_id} {action} (tx: {result})")
+
+    return next_deadline
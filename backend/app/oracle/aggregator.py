@@ -0,0 +1,216 @@
+import asyncio
+import logging
+import statistics
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from app.common.http import get_http_client
+from app.config import settings
+from app.oracle.sources import COINGECKO_IDS
+from app.price.bus import price_bus
+
+logger = logging.getLogger(__name__)
+
+# publish(venue, price, timestamp)
+Publish = Callable[[str, float, float], None]
+
+
+@dataclass
+class Quote:
+    venue: str
+    price: float
+    timestamp: float
+
+
+@dataclass
+class AggregatedPrice:
+    price: float
+    timestamp: float
+    venues: list[str]  # venues that contributed
+    rejected: list[str]  # fresh venues dropped as outliers
+    stale: list[str]  # venues with no quote within max_age
+
+
+# ─── Venue adapters ───
+
+
+class VenueFeed(ABC):
+    """A source of quotes for one venue. Subclasses implement `run`."""
+
+    name: str = ""
+
+    @abstractmethod
+    async def run(self, publish: Publish):
+        """Publish quotes until cancelled."""
+
+
+class BinanceVenue(VenueFeed):
+    """Follows the app-wide Binance trade feed (see `binance_ws_feed`) on the price bus."""
+
+    name = "binance"
+
+    def __init__(self, symbol: str = "btc"):
+        self.symbol = symbol
+
+    async def run(self, publish: Publish):
+        sub = price_bus.subscribe(maxsize=1, symbols={self.symbol})
+        try:
+            async for update in sub:
+                if update.source == "binance":
+                    publish(self.name, update.price, update.timestamp)
+        finally:
+            sub.close()
+
+
+class RestVenue(VenueFeed):
+    """Polls a public REST ticker and extracts the price from its JSON body."""
+
+    def __init__(self, name: str, url: str, extract: Callable[[dict], float], poll_interval: float = 2.0):
+        self.name = name
+        self.url = url
+        self.extract = extract
+        self.poll_interval = poll_interval
+
+    async def run(self, publish: Publish):
+        while True:
+            try:
+                resp = await get_http_client().get(self.url, timeout=5)
+                resp.raise_for_status()
+                publish(self.name, float(self.extract(resp.json())), time.time())
+            except Exception as e:
+                logger.warning(f"{self.name} quote failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+
+def _rest_venues(symbol: str) -> dict[str, Callable[[], VenueFeed]]:
+    sym = symbol.upper()
+    return {
+        "coinbase": lambda: RestVenue(
+            "coinbase",
+            f"https://api.coinbase.com/v2/prices/{sym}-USD/spot",
+            lambda d: d["data"]["amount"],
+        ),
+        "kraken": lambda: RestVenue(
+            "kraken",
+            f"https://api.kraken.com/0/public/Ticker?pair={'XBT' if sym == 'BTC' else sym}USD",
+            lambda d: next(iter(d["result"].values()))["c"][0],
+        ),
+        "okx": lambda: RestVenue(
+            "okx",
+            f"https://www.okx.com/api/v5/market/ticker?instId={sym}-USDT",
+            lambda d: d["data"][0]["last"],
+        ),
+        "coingecko": lambda: RestVenue(
+            "coingecko",
+            f"https://api.coingecko.com/api/v3/simple/price?ids={COINGECKO_IDS[symbol]}&vs_currencies=usd",
+            lambda d: d[COINGECKO_IDS[symbol]]["usd"],
+            poll_interval=15.0,  # free-tier rate limit
+        ),
+    }
+
+
+def build_venues(names: Iterable[str], symbol: str = "btc") -> list[VenueFeed]:
+    """Instantiate venue adapters by name ("binance", "coinbase", "kraken", "okx", "coingecko")."""
+    factories = {"binance": lambda: BinanceVenue(symbol), **_rest_venues(symbol)}
+    venues = []
+    for name in names:
+        name = name.strip().lower()
+        if name in factories:
+            venues.append(factories[name]())
+        elif name:
+            logger.warning(f"Unknown oracle venue: {name}")
+    return venues
+
+
+# ─── Aggregator ───
+
+
+class PriceAggregator:
+    """Latest quote per venue -> one robust price.
+
+    Quotes older than `max_age_sec` are ignored. Fresh quotes deviating more
+    than `max_deviation_bps` from their median are rejected as outliers, and
+    the rest are combined by median or trimmed mean (dropping
+    `trim_fraction` from each end).
+    """
+
+    def __init__(
+        self,
+        venues: list[VenueFeed],
+        max_age_sec: float = 10.0,
+        max_deviation_bps: float = 50.0,
+        min_venues: int = 1,
+        method: str = "median",
+        trim_fraction: float = 0.2,
+    ):
+        if method not in ("median", "trimmed_mean"):
+            raise ValueError(f"Unknown aggregation method: {method}")
+        self.venues = venues
+        self.max_age_sec = max_age_sec
+        self.max_deviation_bps = max_deviation_bps
+        self.min_venues = min_venues
+        self.method = method
+        self.trim_fraction = trim_fraction
+        self._quotes: dict[str, Quote] = {}
+
+    def publish(self, venue: str, price: float, timestamp: float):
+        if price > 0:
+            self._quotes[venue] = Quote(venue, price, timestamp)
+
+    def _combine(self, prices: list[float]) -> float:
+        if self.method == "median":
+            return statistics.median(prices)
+        prices = sorted(prices)
+        k = int(len(prices) * self.trim_fraction)
+        return statistics.fmean(prices[k:len(prices) - k])
+
+    def aggregate(self, now: float | None = None) -> AggregatedPrice | None:
+        """Current aggregate, or None if fewer than `min_venues` fresh quotes agree."""
+        now = time.time() if now is None else now
+        fresh = [q for q in self._quotes.values() if now - q.timestamp <= self.max_age_sec]
+        stale = [v.name for v in self.venues if v.name not in {q.venue for q in fresh}]
+        if not fresh:
+            return None
+
+        mid = statistics.median(q.price for q in fresh)
+        limit = mid * self.max_deviation_bps / 10_000
+        accepted = [q for q in fresh if abs(q.price - mid) <= limit]
+        rejected = [q.venue for q in fresh if abs(q.price - mid) > limit]
+        if len(accepted) < self.min_venues:
+            return None
+
+        return AggregatedPrice(
+            price=self._combine([q.price for q in accepted]),
+            timestamp=max(q.timestamp for q in accepted),
+            venues=[q.venue for q in accepted],
+            rejected=rejected,
+            stale=stale,
+        )
+
+    async def _run_venue(self, venue: VenueFeed):
+        while True:
+            try:
+                await venue.run(self.publish)
+                return  # finite feeds (replays) end here
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Venue {venue.name} failed: {e}, restarting in 5s...")
+                await asyncio.sleep(5)
+
+    async def run(self):
+        """Run every venue feed concurrently."""
+        logger.info(f"Price aggregator started (venues={[v.name for v in self.venues]}, method={self.method})")
+        await asyncio.gather(*(self._run_venue(v) for v in self.venues))
+
+
+# Global singleton (BTC, backs BTCMockOracle)
+oracle_aggregator = PriceAggregator(
+    build_venues(settings.oracle_venues.split(",")),
+    max_age_sec=settings.oracle_quote_max_age,
+    max_deviation_bps=settings.oracle_max_deviation_bps,
+    min_venues=settings.oracle_min_venues,
+    method=settings.oracle_aggregation,
+)
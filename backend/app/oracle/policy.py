@@ -0,0 +1,100 @@
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+
+from app.config import settings
+
+
+@dataclass
+class PushMetrics:
+    sent: int = 0
+    skipped: int = 0
+    failed: int = 0
+    forced: int = 0
+    last_price: float = 0.0
+    last_push_at: float = 0.0
+    last_reason: str = ""
+
+
+class PushPolicy:
+    """Decides when the oracle price is worth a transaction.
+
+    A push goes out when the price has moved more than `deviation_bps` from
+    the last pushed price, when the last push is older than `heartbeat_sec`,
+    or when something (e.g. a round about to lock/close) requests one.
+    """
+
+    def __init__(self, deviation_bps: float, heartbeat_sec: float):
+        self.deviation_bps = deviation_bps
+        self.heartbeat_sec = heartbeat_sec
+        self.metrics = PushMetrics()
+        self._forced_reason = ""
+        self._forced_requested = 0  # push requests so far
+        self._forced_served = 0  # requests covered by a successful push
+        self._forced_deciding = 0  # requests covered by the push `decide` just asked for
+        self._wake = asyncio.Event()
+
+    def request_push(self, reason: str):
+        """Push on the next evaluation regardless of deviation/heartbeat, until a push succeeds."""
+        self._forced_reason = reason
+        self._forced_requested += 1
+        self._wake.set()
+
+    @property
+    def forced(self) -> bool:
+        return self._forced_requested > self._forced_served
+
+    async def wait(self, timeout: float):
+        """Sleep until the next evaluation: `timeout` elapses or a new push is requested.
+
+        A request wakes the caller once; if it can't be served then (no
+        price, failed push) it stays pending for later evaluations, but
+        doesn't cut the next sleep short again.
+        """
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+
+    def decide(self, price: float, now: float | None = None) -> str | None:
+        """Reason to push `price` now, or None to skip."""
+        now = time.time() if now is None else now
+        m = self.metrics
+
+        if self.forced:
+            self._forced_deciding = self._forced_requested
+            return f"forced: {self._forced_reason}"
+        if m.sent == 0:
+            return "initial"
+        if now - m.last_push_at >= self.heartbeat_sec:
+            return "heartbeat"
+        if abs(price - m.last_price) / m.last_price * 10_000 >= self.deviation_bps:
+            return "deviation"
+
+        m.skipped += 1
+        return None
+
+    def record_sent(self, price: float, reason: str, now: float | None = None):
+        m = self.metrics
+        m.sent += 1
+        m.last_price = price
+        m.last_push_at = time.time() if now is None else now
+        m.last_reason = reason
+        if reason.startswith("forced"):
+            m.forced += 1
+            self._forced_served = max(self._forced_served, self._forced_deciding)
+
+    def record_failed(self):
+        self.metrics.failed += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "deviation_bps": self.deviation_bps,
+            "heartbeat_sec": self.heartbeat_sec,
+            **asdict(self.metrics),
+        }
+
+
+# Global singleton
+push_policy = PushPolicy(settings.oracle_deviation_bps, settings.oracle_heartbeat)
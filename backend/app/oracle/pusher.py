@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+
+from app.common.tx_manager import PendingTx, tx_manager
+from app.config import settings
+from app.oracle.contracts import get_oracle_contract
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingPush:
+    """The oracle update currently in the mempool; replacements reuse its nonce."""
+
+    tx: PendingTx
+    price: float  # newest price sent at this nonce
+    versions: dict[str, float] = field(default_factory=dict)  # tx hash -> price
+
+
+@dataclass
+class PusherMetrics:
+    broadcast: int = 0
+    replaced: int = 0
+    confirmed: int = 0
+    reverted: int = 0
+    send_failed: int = 0
+    skipped: int = 0  # pushes not sent while the pending nonce was at the replacement cap
+    last_confirmed_price: float = 0.0
+    last_confirmed_at: float = 0.0
+    last_confirm_latency: float = 0.0  # first broadcast -> receipt seen (seconds)
+
+
+class OraclePusher:
+    """Fire-and-forget oracle updates.
+
+    `push` broadcasts `updatePrice` through the transaction manager and
+    returns without waiting for a receipt. If the previous push is still
+    pending, the new price replaces it at the same nonce with bumped fees,
+    so the newest price is what lands. Confirmations come from the
+    manager's shared receipt tracker.
+    """
+
+    def __init__(self, max_replacements: int = 10):
+        self.max_replacements = max_replacements
+        self.pending: PendingPush | None = None
+        self.metrics = PusherMetrics()
+        self._lock = asyncio.Lock()
+
+    async def push(self, price_usd: float) -> str | None:
+        """Broadcast `price_usd` (1e18 scale on-chain). Returns the tx hash.
+
+        Returns None without sending if the pending push was already
+        replaced `max_replacements` times: it waits for that nonce to be mined.
+        """
+        async with self._lock:
+            fn = get_oracle_contract().functions.updatePrice(int(price_usd * 1e18))
+            pending = self.pending
+
+            if pending is not None and len(pending.versions) > self.max_replacements:
+                self.metrics.skipped += 1
+                return None
+
+            try:
+                if pending is None:
+                    tx = await tx_manager.submit(fn, label="oracle")
+                    tx_hash = tx.versions[-1]
+                else:
+                    # Fails with "nonce too low" if a previous version was mined meanwhile
+                    tx_hash = await tx_manager.replace(pending.tx, fn)
+            except Exception:
+                self.metrics.send_failed += 1
+                raise
+
+            if pending is None:
+                pending = self.pending = PendingPush(tx, price_usd, {tx_hash: price_usd})
+                tx.done.add_done_callback(lambda _: self._settle(pending))
+                self.metrics.broadcast += 1
+            else:
+                pending.price = price_usd
+                pending.versions[tx_hash] = price_usd
+                self.metrics.replaced += 1
+            return tx_hash
+
+    def _settle(self, pending: PendingPush):
+        if self.pending is pending:
+            self.pending = None
+        tx = pending.tx
+        m = self.metrics
+        if tx.status != 1:
+            m.reverted += 1
+            logger.error(f"Oracle push at nonce {tx.nonce} failed: {tx.done.exception()}")
+            return
+        price = pending.versions.get(tx.mined_hash, pending.price)
+        m.confirmed += 1
+        m.last_confirmed_price = price
+        m.last_confirmed_at = time.time()
+        m.last_confirm_latency = m.last_confirmed_at - tx.sent_at
+        logger.info(f"Oracle price confirmed: ${price:,.2f} (nonce {tx.nonce}, tx: {tx.mined_hash})")
+
+    def snapshot(self) -> dict:
+        pending = self.pending
+        return {
+            **asdict(self.metrics),
+            "pending": None if pending is None else {
+                "nonce": pending.tx.nonce,
+                "price": pending.price,
+                "max_fee": pending.tx.fees.max_fee,
+                "age": time.time() - pending.tx.sent_at,
+                "versions": len(pending.versions),
+            },
+        }
+
+
+# Global singleton
+oracle_pusher = OraclePusher(max_replacements=settings.oracle_max_replacements)
@@ -0,0 +1,26 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter
+
+from app.common.chain_head import head_watcher
+from app.common.tx_manager import tx_manager
+from app.common.web3_client import get_w3
+from app.oracle.aggregator import oracle_aggregator
+from app.oracle.policy import push_policy
+from app.oracle.pusher import oracle_pusher
+
+router = APIRouter(prefix="/api/oracle", tags=["oracle"])
+
+
+@router.get("/status")
+async def get_oracle_status():
+    """Aggregated price inputs, push policy metrics and on-chain confirmation tracking."""
+    aggregate = oracle_aggregator.aggregate()
+    return {
+        "aggregate": asdict(aggregate) if aggregate is not None else None,
+        "push": push_policy.snapshot(),
+        "tx": oracle_pusher.snapshot(),
+        "operator_txs": tx_manager.snapshot(),
+        "chain_head": head_watcher.snapshot(),
+        "rpc": get_w3().provider.snapshot(),
+    }
@@ -2,45 +2,77 @@ import asyncio
 import logging
 
 from app.config import settings
-from app.oracle.contracts import push_price
-from app.oracle.sources import binance_ws_feed, coingecko_fallback, get_latest_price
+from app.oracle.aggregator import oracle_aggregator
+from app.oracle.policy import push_policy
+from app.oracle.pusher import oracle_pusher
+from app.oracle.sources import coingecko_fallback
+from app.price.bus import Subscription, price_bus
 
 logger = logging.getLogger(__name__)
 
 
+async def _next_trigger(sub: Subscription, timeout: float) -> bool:
+    """Wait for a BTC price update, a forced push request or `timeout`.
+
+    Returns True if woken by a price update.
+    """
+    update = asyncio.ensure_future(sub.get())
+    forced = asyncio.ensure_future(push_policy.wait(timeout))
+    done, pending = await asyncio.wait({update, forced}, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+    return update in done
+
+
 async def oracle_push_loop():
-    """Background task: push BTC price to oracle every N seconds."""
-    logger.info(f"Oracle push loop started (interval={settings.oracle_push_interval}s)")
+    """Background task: evaluate the push policy on every BTC price update and push when it says so."""
+    logger.info(
+        f"Oracle push loop started (idle interval={settings.oracle_push_interval}s, "
+        f"deviation={settings.oracle_deviation_bps}bps, heartbeat={settings.oracle_heartbeat}s)"
+    )
+
+    # maxsize=1: a push in flight only ever leaves the newest update pending
+    sub = price_bus.subscribe(maxsize=1, symbols={"btc"})
+    woken_by_price = False
 
     while True:
         try:
-            price = get_latest_price()
-
-            # Fallback to CoinGecko if no Binance data
-            if price <= 0:
+            aggregate = oracle_aggregator.aggregate()
+            if aggregate is not None:
+                price = aggregate.price
+                if aggregate.rejected:
+                    logger.warning(f"Oracle outlier venues rejected: {aggregate.rejected}")
+            elif not woken_by_price:
+                # Fallback to CoinGecko if no venue quorum (rate-limited to one request per COINGECKO_MIN_INTERVAL)
                 price = await coingecko_fallback()
+            else:
+                price = 0.0
 
             if price > 0:
-                await push_price(price)
-            else:
+                reason = push_policy.decide(price)
+                if reason is not None:
+                    try:
+                        # Returns once broadcast; a pending push is replaced in place
+                        # (None: its nonce is at the replacement cap, retried on a later evaluation)
+                        if await oracle_pusher.push(price) is not None:
+                            push_policy.record_sent(price, reason)
+                            logger.info(f"Oracle push ({reason})")
+                    except Exception:
+                        push_policy.record_failed()
+                        raise
+            elif not woken_by_price:
                 logger.warning("No price available to push")
 
         except Exception as e:
             logger.error(f"Oracle push error: {e}")
 
-        await asyncio.sleep(settings.oracle_push_interval)
+        woken_by_price = await _next_trigger(sub, settings.oracle_push_interval)
 
 
 async def start_oracle_service():
-    """Start the Binance WS feed + oracle push loop."""
+    """Start the venue feeds and oracle push loop (the Binance feed and tx tracker run app-wide, see main.py)."""
     logger.info(f"Starting oracle service (source={settings.price_source})")
-
-    if settings.price_source == "binance":
-        # Start WS feed and push loop concurrently
-        await asyncio.gather(
-            binance_ws_feed(),
-            oracle_push_loop(),
-        )
-    else:
-        # CoinGecko-only mode: just poll + push
-        await oracle_push_loop()
+    await asyncio.gather(
+        oracle_aggregator.run(),
+        oracle_push_loop(),
+    )
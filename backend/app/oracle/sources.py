@@ -1,54 +1,211 @@
 import asyncio
-import json
 import logging
-from typing import Callable
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterable
 
-import httpx
 import websockets
 
+from app.common.http import get_http_client
+from app.config import settings
+from app.price.bus import price_bus
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # optional: pip install "snowball-backend[fast]"
+    from json import loads as _loads
+
 logger = logging.getLogger(__name__)
 
-# Latest BTC price in USD
-_latest_price: float = 0.0
+BINANCE_STREAM_URL = "wss://stream.binance.com:9443/stream?streams="
+
+COINGECKO_IDS = {
+    "btc": "bitcoin",
+    "eth": "ethereum",
+    "sol": "solana",
+    "bnb": "binancecoin",
+    "xrp": "ripple",
+}
+
+
+def get_latest_price(symbol: str = "btc") -> float:
+    update = price_bus.latest.get(symbol)
+    return update.price if update else 0.0
+
+
+@dataclass
+class FeedStats:
+    """Counters for the Binance trade feed (see `binance_ws_feed`)."""
+
+    frames: int = 0
+    trades: int = 0
+    batches: int = 0
+    max_batch: int = 0
+    dropped: int = 0  # frames discarded: backlog overflow or undecodable
+    late: int = 0  # trades older than `binance_late_ms` when decoded
+    last_lag_ms: float = 0.0  # receive lag of the newest trade in the last batch
+
+
+feed_stats = FeedStats()
+
+
+def decoder_name() -> str:
+    return _loads.__module__
+
+# on_trades(symbol, exchange times in seconds, prices, quantities)
+OnTrades = Callable[[str, array, array, array], None]
+
+
+def _decode_frames(frames: list[bytes]) -> list[dict]:
+    try:
+        # One decoder call for the whole batch instead of one per frame
+        return _loads(b"[" + b",".join(frames) + b"]")
+    except ValueError:
+        # A single bad frame spoils the joined array; isolate it
+        messages = []
+        for frame in frames:
+            try:
+                messages.append(_loads(frame))
+            except ValueError:
+                feed_stats.dropped += 1
+        return messages
+
+
+def _process_batch(frames: list[bytes], pairs: dict[str, str], on_trades: OnTrades | None):
+    """Decode a batch of combined-stream trade frames and fan them out per symbol.
 
+    Trades go to `on_trades` as columns; only the newest price per symbol is
+    published on `price_bus` (bus consumers conflate to it anyway).
+    """
+    columns: dict[str, tuple[array, array, array]] = {}
+    late_before = time.time() - settings.binance_late_ms / 1000
+    late = 0
 
-def get_latest_price() -> float:
-    return _latest_price
+    for message in _decode_frames(frames):
+        try:
+            data = message["data"]
+            symbol = pairs[data["s"]]
+            trade_time = data["T"] / 1000
+            price = float(data["p"])
+            quantity = float(data["q"])
+        except (KeyError, TypeError, ValueError):
+            feed_stats.dropped += 1
+            continue
+        cols = columns.get(symbol)
+        if cols is None:
+            cols = columns[symbol] = (array("d"), array("d"), array("d"))
+        cols[0].append(trade_time)
+        cols[1].append(price)
+        cols[2].append(quantity)
+        if trade_time < late_before:
+            late += 1
+
+    now = time.time()
+    stats = feed_stats
+    stats.frames += len(frames)
+    stats.batches += 1
+    stats.max_batch = max(stats.max_batch, len(frames))
+    stats.late += late
+
+    for symbol, (timestamps, prices, quantities) in columns.items():
+        stats.trades += len(prices)
+        stats.last_lag_ms = (now - timestamps[-1]) * 1000
+        price_bus.publish(symbol, prices[-1], timestamps[-1], "binance")
+        if on_trades:
+            on_trades(symbol, timestamps, prices, quantities)
+
+
+async def _read_frames(ws, backlog: deque[bytes], ready: asyncio.Event):
+    received = 0
+    while True:
+        frame = await ws.recv(decode=False)
+        if len(backlog) == backlog.maxlen:
+            feed_stats.dropped += 1  # the decoder fell behind; oldest frame is discarded
+        backlog.append(frame)
+        ready.set()
+
+        # Buffered frames are returned without suspending; yield periodically
+        # so the decoder and HTTP handlers get a turn during bursts
+        received += 1
+        if received % 256 == 0:
+            await asyncio.sleep(0)
+
+
+async def _decode_loop(
+    backlog: deque[bytes], ready: asyncio.Event, pairs: dict[str, str], on_trades: OnTrades | None
+):
+    while True:
+        await ready.wait()
+        ready.clear()
+        frames = list(backlog)
+        backlog.clear()
+        try:
+            _process_batch(frames, pairs, on_trades)
+        except Exception as e:
+            logger.error(f"Binance batch error: {e}")
 
 
-async def binance_ws_feed(on_price: Callable[[float], None] | None = None):
-    """Subscribe to Binance btcusdt@trade WebSocket for real-time prices."""
-    global _latest_price
-    uri = "wss://stream.binance.com:9443/ws/btcusdt@trade"
+async def binance_ws_feed(symbols: Iterable[str] = ("btc",), on_trades: OnTrades | None = None):
+    """Subscribe to Binance <symbol>usdt@trade for all symbols over one combined stream.
+
+    A reader task only queues raw frames; a decoder drains whatever has
+    accumulated in one batch, decodes it with a single JSON call (orjson when
+    installed), hands trades to `on_trades` as columns per symbol and
+    publishes the newest price per symbol on `price_bus`. Counters are kept
+    in `feed_stats`.
+    """
+    pairs = {f"{s}usdt".upper(): s for s in symbols}
+    uri = BINANCE_STREAM_URL + "/".join(f"{pair.lower()}@trade" for pair in pairs)
 
     while True:
         try:
             async with websockets.connect(uri) as ws:
-                logger.info("Connected to Binance WS")
-                async for msg in ws:
-                    data = json.loads(msg)
-                    price = float(data["p"])
-                    _latest_price = price
-                    if on_price:
-                        on_price(price)
+                logger.info(f"Connected to Binance WS ({', '.join(pairs.values())})")
+                backlog: deque[bytes] = deque(maxlen=settings.binance_max_backlog)
+                ready = asyncio.Event()
+                decoder = asyncio.create_task(_decode_loop(backlog, ready, pairs, on_trades))
+                try:
+                    await _read_frames(ws, backlog, ready)
+                finally:
+                    decoder.cancel()
+                    if backlog:
+                        _process_batch(list(backlog), pairs, on_trades)
         except Exception as e:
             logger.warning(f"Binance WS error: {e}, reconnecting in 5s...")
             await asyncio.sleep(5)
 
 
-async def coingecko_fallback() -> float:
-    """Fallback: fetch BTC price from CoinGecko REST API."""
-    global _latest_price
-    url = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd"
+# symbol -> monotonic time of the last CoinGecko request
+_coingecko_last: dict[str, float] = {}
+
+
+async def coingecko_fallback(symbol: str = "btc") -> float:
+    """Fallback: fetch a USD price from CoinGecko REST API.
+
+    At most one request per COINGECKO_MIN_INTERVAL per symbol (free-tier
+    rate limit); calls in between return the latest known price.
+    """
+    coin_id = COINGECKO_IDS.get(symbol)
+    if coin_id is None:
+        logger.error(f"No CoinGecko id for {symbol}")
+        return get_latest_price(symbol)
+
+    now = time.monotonic()
+    if now - _coingecko_last.get(symbol, float("-inf")) < settings.coingecko_min_interval:
+        return get_latest_price(symbol)
+    _coingecko_last[symbol] = now
+
+    url = f"https://api.coingecko.com/api/v3/simple/price?ids={coin_id}&vs_currencies=usd"
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            price = float(data["bitcoin"]["usd"])
-            _latest_price = price
-            logger.info(f"CoinGecko BTC price: ${price:,.2f}")
-            return price
+        resp = await get_http_client().get(url)
+        resp.raise_for_status()
+        data = resp.json()
+        price = float(data[coin_id]["usd"])
+        price_bus.publish(symbol, price, source="coingecko")
+        logger.info(f"CoinGecko {symbol.upper()} price: ${price:,.2f}")
+        return price
     except Exception as e:
         logger.error(f"CoinGecko fetch failed: {e}")
-        return _latest_price
+        return get_latest_price(symbol)
@@ -0,0 +1,84 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PriceUpdate:
+    symbol: str
+    price: float
+    timestamp: float
+    source: str = ""
+
+
+class Subscription:
+    """One consumer's bounded view of the bus.
+
+    When the queue is full the oldest pending update is dropped (conflation),
+    so a slow consumer always catches up to the newest prices and never
+    blocks the publisher or other subscribers.
+    """
+
+    def __init__(self, bus: "PriceBus", maxsize: int, symbols: frozenset[str] | None):
+        self._bus = bus
+        self._queue: asyncio.Queue[PriceUpdate] = asyncio.Queue(maxsize)
+        self.symbols = symbols
+        self.conflated = 0
+
+    def _offer(self, update: PriceUpdate):
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.conflated += 1
+        self._queue.put_nowait(update)
+
+    async def get(self) -> PriceUpdate:
+        return await self._queue.get()
+
+    def drain(self) -> dict[str, PriceUpdate]:
+        """Pop everything pending, keeping only the newest update per symbol."""
+        latest: dict[str, PriceUpdate] = {}
+        while not self._queue.empty():
+            update = self._queue.get_nowait()
+            latest[update.symbol] = update
+        return latest
+
+    def close(self):
+        self._bus.unsubscribe(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> PriceUpdate:
+        return await self.get()
+
+
+class PriceBus:
+    """In-process publish/subscribe for price updates.
+
+    Publishing is synchronous and O(subscribers); consumers await their own
+    subscription instead of polling module globals.
+    """
+
+    def __init__(self):
+        self._subscribers: list[Subscription] = []
+        self.latest: dict[str, PriceUpdate] = {}
+
+    def subscribe(self, maxsize: int = 16, symbols: set[str] | None = None) -> Subscription:
+        sub = Subscription(self, maxsize, frozenset(symbols) if symbols is not None else None)
+        self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        if sub in self._subscribers:
+            self._subscribers.remove(sub)
+
+    def publish(self, symbol: str, price: float, timestamp: float | None = None, source: str = ""):
+        update = PriceUpdate(symbol, price, time.time() if timestamp is None else timestamp, source)
+        self.latest[symbol] = update
+        for sub in self._subscribers:
+            if sub.symbols is None or symbol in sub.symbols:
+                sub._offer(update)
+
+
+# Global singleton
+price_bus = PriceBus()
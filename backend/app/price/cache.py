@@ -1,6 +1,17 @@
+import logging
+import struct
 import time
-from collections import deque
-from dataclasses import dataclass, field
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Iterator
+
+import numpy as np
+
+from app.price.tick_log import TickLog
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -19,78 +30,560 @@ class OHLCVBar:
     timestamp: float = 0.0
 
 
+class _ColumnRing:
+    """Fixed-capacity ring buffer of parallel float64 columns.
+
+    Rows live in preallocated `array('d')` columns (8 bytes per value) with a
+    head index, so appends never allocate and reads are C-level slices instead
+    of walks over Python objects. Logical index 0 is the oldest row.
+    """
+
+    def __init__(self, columns: tuple[str, ...], capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._cols: dict[str, array] = {
+            name: array("d", bytes(8 * capacity)) for name in columns
+        }
+        self._head = 0  # physical index of the next write
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, **row: float):
+        head = self._head
+        for name, col in self._cols.items():
+            col[head] = row[name]
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, **cols: array):
+        """Bulk-append equal-length columns with slice assignment."""
+        n = len(next(iter(cols.values())))
+        skip = max(0, n - self.capacity)  # only the newest `capacity` rows survive
+        pos = skip
+        while pos < n:
+            run = min(n - pos, self.capacity - self._head)
+            for name, col in self._cols.items():
+                col[self._head:self._head + run] = cols[name][pos:pos + run]
+            self._head = (self._head + run) % self.capacity
+            pos += run
+        self._size = min(self.capacity, self._size + n - skip)
+
+    def _physical(self, i: int) -> int:
+        return (self._head - self._size + i) % self.capacity
+
+    def get(self, name: str, i: int) -> float:
+        """Value of column `name` at logical row `i` (negative counts from newest)."""
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError("ring index out of range")
+        return self._cols[name][self._physical(i)]
+
+    def slice(self, name: str, lo: int = 0, hi: int | None = None) -> array:
+        """Copy logical rows [lo, hi) of column `name` into a contiguous array."""
+        hi = self._size if hi is None else min(hi, self._size)
+        lo = max(lo, 0)
+        if lo >= hi:
+            return array("d")
+        col = self._cols[name]
+        start = self._physical(lo)
+        end = start + (hi - lo)
+        if end <= self.capacity:
+            return col[start:end]
+        return col[start:] + col[: end - self.capacity]
+
+    def ndarray(self, name: str, lo: int = 0, hi: int | None = None) -> np.ndarray:
+        """Logical rows [lo, hi) of column `name` as a NumPy array.
+
+        A view of the column (no copy) unless the rows wrap around the ring;
+        only valid until the next write.
+        """
+        hi = self._size if hi is None else min(hi, self._size)
+        lo = max(lo, 0)
+        if lo >= hi:
+            return np.empty(0)
+        col = np.frombuffer(self._cols[name], dtype=np.float64)
+        start = self._physical(lo)
+        end = start + (hi - lo)
+        if end <= self.capacity:
+            return col[start:end]
+        return np.concatenate((col[start:], col[: end - self.capacity]))
+
+    def bisect_left(self, name: str, x: float) -> int:
+        """Logical index of the first row with `name` >= x (column must be sorted)."""
+        return self._bisect(bisect_left, name, x)
+
+    def bisect_right(self, name: str, x: float) -> int:
+        """Logical index of the first row with `name` > x (column must be sorted)."""
+        return self._bisect(bisect_right, name, x)
+
+    def _bisect(self, search, name: str, x: float) -> int:
+        # A sorted ring is at most two sorted physical runs; bisect the arrays
+        # in place (C-level, no copy), falling through to the second run.
+        col = self._cols[name]
+        start = self._physical(0)
+        end = start + self._size
+        if end <= self.capacity:
+            return search(col, x, start, end) - start
+        i = search(col, x, start, self.capacity)
+        if i < self.capacity:
+            return i - start
+        return (self.capacity - start) + search(col, x, 0, end - self.capacity)
+
+
+class _BarSeries:
+    """OHLCV bars at one fixed resolution, updated incrementally per tick.
+
+    Finished bars are kept in a `_ColumnRing`; the bar still being filled is
+    held separately so reads are O(limit) regardless of how many ticks exist.
+    """
+
+    _COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+    def __init__(self, interval_sec: int, max_bars: int):
+        self.interval_sec = interval_sec
+        self._bars = _ColumnRing(self._COLUMNS, max_bars)
+        self._open: OHLCVBar | None = None
+
+    def update(self, ts: float, price: float, volume: float):
+        self._fold(ts - (ts % self.interval_sec), price, price, price, price, volume)
+
+    def extend(self, ts: array, prices: array, volumes: array):
+        """Fold a chronological batch of ticks in, one bar bucket at a time."""
+        n = len(ts)
+        i = 0
+        while i < n:
+            bar_start = ts[i] - (ts[i] % self.interval_sec)
+            j = bisect_left(ts, bar_start + self.interval_sec, i)
+            p = prices[i:j]
+            self._fold(bar_start, p[0], max(p), min(p), p[-1], sum(volumes[i:j]))
+            i = j
+
+    def _fold(self, bar_start: float, open_: float, high: float, low: float, close: float, volume: float):
+        bar = self._open
+
+        if bar is None or bar_start > bar.timestamp:
+            if bar is not None:
+                self._bars.append(
+                    timestamp=bar.timestamp,
+                    open=bar.open,
+                    high=bar.high,
+                    low=bar.low,
+                    close=bar.close,
+                    volume=bar.volume,
+                )
+            self._open = OHLCVBar(
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+                timestamp=bar_start,
+            )
+            return
+
+        # Late ticks (clock jitter) fold into the open bar
+        if high > bar.high:
+            bar.high = high
+        if low < bar.low:
+            bar.low = low
+        bar.close = close
+        bar.volume += volume
+
+    def window(self, start: float, end: float | None, limit: int) -> list[OHLCVBar]:
+        """Up to `limit` most recent bars overlapping [start, end), open bar included."""
+        # Bars starting after `start - interval` end after `start`
+        lo = self._bars.bisect_right("timestamp", start - self.interval_sec)
+        hi = len(self._bars) if end is None else self._bars.bisect_left("timestamp", end)
+        lo = max(lo, hi - limit)
+        cols = [self._bars.slice(name, lo, hi) for name in self._COLUMNS]
+
+        bars = [
+            OHLCVBar(open=o, high=h, low=l, close=c, volume=v, timestamp=t)
+            for t, o, h, l, c, v in zip(*cols)
+        ]
+        bar = self._open
+        if (
+            bar is not None
+            and bar.timestamp + self.interval_sec > start
+            and (end is None or bar.timestamp < end)
+        ):
+            bars.append(OHLCVBar(**vars(bar)))
+
+        return bars[-limit:]
+
+    def iter_chunks(
+        self, start: float, end: float | None, chunk_rows: int
+    ) -> Iterator[tuple[array, ...]]:
+        """Yield the columns of all bars overlapping [start, end), oldest first, in bounded chunks.
+
+        Like `PriceCache.iter_tick_chunks`, each chunk is located by
+        timestamp, so bars finished between chunks are neither skipped nor
+        repeated. The open bar comes last.
+        """
+        cursor = start - self.interval_sec  # bars starting after this end after `start`
+        while True:
+            lo = self._bars.bisect_right("timestamp", cursor)
+            hi = len(self._bars) if end is None else self._bars.bisect_left("timestamp", end)
+            hi = min(hi, lo + chunk_rows)
+            if lo >= hi:
+                break
+            cols = tuple(self._bars.slice(name, lo, hi) for name in self._COLUMNS)
+            yield cols
+            cursor = cols[0][-1]
+
+        bar = self._open
+        if bar is not None and bar.timestamp > cursor and (end is None or bar.timestamp < end):
+            yield tuple(array("d", [getattr(bar, name)]) for name in self._COLUMNS)
+
+    def dump(self) -> bytes:
+        """Finished bars and the open bar, for `PriceCache.rollup_snapshot`."""
+        bar = self._open
+        parts = [_SERIES.pack(self.interval_sec, len(self._bars), bar is not None)]
+        parts += [self._bars.slice(name).tobytes() for name in self._COLUMNS]
+        if bar is not None:
+            parts.append(array("d", [getattr(bar, name) for name in self._COLUMNS]).tobytes())
+        return b"".join(parts)
+
+    def load(self, cols: list[array], open_bar: array | None):
+        """Replace the contents with dumped columns (oldest first) and open bar."""
+        self._bars = _ColumnRing(self._COLUMNS, self._bars.capacity)
+        if cols[0]:
+            self._bars.extend(**dict(zip(self._COLUMNS, cols)))
+        self._open = None if open_bar is None else OHLCVBar(**dict(zip(self._COLUMNS, open_bar)))
+
+
+def _merge_bars(bars: list[OHLCVBar], interval_sec: int) -> list[OHLCVBar]:
+    """Merge chronological finer bars into `interval_sec` buckets."""
+    merged: list[OHLCVBar] = []
+    for bar in bars:
+        bucket = bar.timestamp - (bar.timestamp % interval_sec)
+        last = merged[-1] if merged else None
+        if last is None or bucket > last.timestamp:
+            merged.append(OHLCVBar(**{**vars(bar), "timestamp": bucket}))
+        else:
+            last.high = max(last.high, bar.high)
+            last.low = min(last.low, bar.low)
+            last.close = bar.close
+            last.volume += bar.volume
+    return merged
+
+
+# Resolutions maintained incrementally by PriceCache (1m, 5m, 15m, 1h, 4h, 1d)
+ROLLUP_INTERVALS: tuple[int, ...] = (60, 300, 900, 3600, 14_400, 86_400)
+
+# Rollup snapshot layout: header, then per series a header, its six columns
+# (float64, oldest bar first) and the open bar's six values if it has one
+_SNAPSHOT = struct.Struct("<4sHHd")  # magic, version, series count, last tick folded in
+_SERIES = struct.Struct("<QQB")  # interval, finished bars, has open bar
+_SNAPSHOT_MAGIC = b"SBRU"
+_SNAPSHOT_VERSION = 1
+
+
 class PriceCache:
     """In-memory price history with OHLCV aggregation."""
 
-    def __init__(self, max_ticks: int = 86_400):
-        self._ticks: deque[PriceTick] = deque(maxlen=max_ticks)
+    def __init__(self, max_ticks: int = 86_400, max_bars: int = 20_160):
+        self.max_bars = max_bars
+        self._ticks = _ColumnRing(("timestamp", "price", "volume"), max_ticks)
+        self._rollups: dict[int, _BarSeries] = {
+            interval: _BarSeries(interval, max_bars) for interval in ROLLUP_INTERVALS
+        }
+        self._log: TickLog | None = None
+        # Bumped on every write so readers can tell when derived data is stale
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def add_tick(self, price: float, volume: float = 0.0):
+        ts = time.time()
+        if self._ticks:
+            # Keep the timestamp column monotonic so range queries can bisect it
+            ts = max(ts, self._ticks.get("timestamp", -1))
+        self._ticks.append(timestamp=ts, price=price, volume=volume)
+        for series in self._rollups.values():
+            series.update(ts, price, volume)
+        if self._log is not None:
+            self._log.append(ts, price, volume)
+        self.version += 1
+
+    def add_trades(self, timestamps: array, prices: array, volumes: array):
+        """Append a chronological batch of trades (exchange time, price, quantity).
+
+        Columns, rollups and the tick log are all updated with bulk array
+        operations, so cost is per batch and per bar rather than per trade.
+        """
+        if not prices:
+            return
+        if self._ticks:
+            floor = self._ticks.get("timestamp", -1)
+        else:
+            floor = timestamps[0]
+        # Running max keeps the column monotonic across venue clock skew
+        timestamps = array("d", accumulate(timestamps, max, initial=floor))[1:]
+
+        self._ticks.extend(timestamp=timestamps, price=prices, volume=volumes)
+        for series in self._rollups.values():
+            series.extend(timestamps, prices, volumes)
+        if self._log is not None:
+            self._log.extend(timestamps, prices, volumes)
+        self.version += 1
+
+    def attach_log(self, log: TickLog) -> int:
+        """Restore history from a durable tick log, then persist new ticks to it.
+
+        Rollups come from the log's snapshot (see `rollup_snapshot`), so only
+        the newest segments are read: enough to refill the tick ring and to
+        fold in the ticks logged after the snapshot was taken. Without a
+        snapshot the rollups are rebuilt from those ticks alone. Returns the
+        number of ticks restored.
+        """
+        log.open()
+        through = self._load_rollups(log)
+        restored = 0
+        for ts, prices, volumes in log.read(since=through, max_records=self._ticks.capacity):
+            if self._ticks:
+                # Drop anything that would break timestamp monotonicity
+                lo = bisect_right(ts, self._ticks.get("timestamp", -1))
+                ts, prices, volumes = ts[lo:], prices[lo:], volumes[lo:]
+                if not ts:
+                    continue
+            self._ticks.extend(timestamp=ts, price=prices, volume=volumes)
+            # Ticks up to `through` are already in the restored rollups
+            lo = 0 if through is None else bisect_right(ts, through)
+            if lo < len(ts):
+                for series in self._rollups.values():
+                    series.extend(ts[lo:], prices[lo:], volumes[lo:])
+            restored += len(ts)
+
+        self._log = log
+        self.version += 1
+        return restored
+
+    def _load_rollups(self, log: TickLog) -> float | None:
+        """Restore rollups from the log's snapshot; returns the last tick folded into them."""
+        data = log.load_snapshot()
+        if data is None:
+            return None
+        try:
+            magic, version, count, through = _SNAPSHOT.unpack_from(data, 0)
+            if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+                raise ValueError("unrecognized header")
+            offset = _SNAPSHOT.size
+            loaded = []
+            for _ in range(count):
+                interval, n, has_open = _SERIES.unpack_from(data, offset)
+                offset += _SERIES.size
+                cols = []
+                for _ in _BarSeries._COLUMNS:
+                    col = array("d")
+                    col.frombytes(data[offset:offset + 8 * n])
+                    cols.append(col)
+                    offset += 8 * n
+                open_bar = None
+                if has_open:
+                    open_bar = array("d")
+                    open_bar.frombytes(data[offset:offset + 8 * len(_BarSeries._COLUMNS)])
+                    offset += 8 * len(_BarSeries._COLUMNS)
+                if len(cols[-1]) != n or (open_bar is not None and len(open_bar) != len(_BarSeries._COLUMNS)):
+                    raise ValueError("truncated")
+                loaded.append((interval, cols, open_bar))
+        except (ValueError, struct.error) as e:
+            logger.warning(f"Ignoring rollup snapshot in {log.directory}: {e}")
+            return None
+
+        for interval, cols, open_bar in loaded:
+            series = self._rollups.get(interval)
+            if series is not None:
+                series.load(cols, open_bar)
+        return through
+
+    def rollup_snapshot(self) -> bytes | None:
+        """Serialized rollups, or None if there is no log to keep them in or nothing to keep.
+
+        Taken on the event loop (C-level column copies); write it with
+        `save_rollups` from any thread.
+        """
+        if self._log is None or not self._ticks:
+            return None
+        header = _SNAPSHOT.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, len(self._rollups), self._ticks.get("timestamp", -1))
+        return header + b"".join(series.dump() for series in self._rollups.values())
+
+    def save_rollups(self, data: bytes | None = None):
+        """Write a rollup snapshot (default: a fresh one) next to the tick log."""
+        log = self._log
+        data = self.rollup_snapshot() if data is None else data
+        if log is not None and data is not None:
+            log.save_snapshot(data)
 
-    def add_tick(self, price: float):
-        self._ticks.append(PriceTick(price=price, timestamp=time.time()))
+    def close_log(self):
+        if self._log is not None:
+            self.save_rollups()
+            self._log.close()
+            self._log = None
 
     @property
     def latest(self) -> PriceTick | None:
-        return self._ticks[-1] if self._ticks else None
+        if not self._ticks:
+            return None
+        return PriceTick(
+            price=self._ticks.get("price", -1),
+            timestamp=self._ticks.get("timestamp", -1),
+        )
+
+    def _tick_range(self, start: float, end: float | None) -> tuple[int, int]:
+        """Logical tick indices [lo, hi) covering timestamps in [start, end)."""
+        lo = self._ticks.bisect_left("timestamp", start)
+        hi = len(self._ticks) if end is None else self._ticks.bisect_left("timestamp", end)
+        return lo, hi
+
+    def tick_columns(self, start: float, end: float | None = None) -> tuple[array, array, array]:
+        """Copy (timestamps, prices, volumes) for ticks in [start, end) as flat arrays."""
+        lo, hi = self._tick_range(start, end)
+        return (
+            self._ticks.slice("timestamp", lo, hi),
+            self._ticks.slice("price", lo, hi),
+            self._ticks.slice("volume", lo, hi),
+        )
+
+    def iter_tick_chunks(
+        self, start: float, end: float | None = None, chunk_rows: int = 65_536
+    ) -> Iterator[tuple[array, array, array]]:
+        """Yield (timestamps, prices, volumes) for [start, end) in bounded chunks.
+
+        Each chunk is located by timestamp rather than ring position, so ticks
+        appended (and evicted) between chunks never cause skips or repeats.
+        """
+        cursor, skip = start, 0
+        while True:
+            lo, hi = self._tick_range(cursor, end)
+            lo += skip
+            hi = min(hi, lo + chunk_rows)
+            if lo >= hi:
+                return
+            ts = self._ticks.slice("timestamp", lo, hi)
+            yield ts, self._ticks.slice("price", lo, hi), self._ticks.slice("volume", lo, hi)
 
-    def history(self, interval_sec: int = 60, limit: int = 100) -> list[PriceTick]:
-        """Return sampled price history at given interval."""
+            # Resume after the last timestamp, skipping its rows already sent
+            last = ts[-1]
+            skip = len(ts) - bisect_left(ts, last)
+            if cursor == last:
+                skip += lo - self._ticks.bisect_left("timestamp", cursor)
+            cursor = last
+
+    def history(
+        self,
+        interval_sec: int = 60,
+        limit: int = 100,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> list[PriceTick]:
+        """Return sampled price history at given interval.
+
+        Without `start`, the window is the `limit` intervals ending at `end`
+        (default: now). Only ticks inside the window are visited.
+        """
         if not self._ticks:
             return []
 
+        if start is None:
+            start = (time.time() if end is None else end) - interval_sec * limit
+        lo, hi = self._tick_range(start, end)
+        min_gap = interval_sec * 0.9
+
         result: list[PriceTick] = []
-        now = time.time()
-        cutoff = now - interval_sec * limit
-
-        # Sample at interval boundaries
-        bucket_start = cutoff
-        for tick in self._ticks:
-            if tick.timestamp < cutoff:
-                continue
-            while tick.timestamp >= bucket_start + interval_sec:
-                bucket_start += interval_sec
-            if not result or (tick.timestamp - result[-1].timestamp) >= interval_sec * 0.9:
-                result.append(tick)
+        last_ts = float("-inf")
+        for ts, price in zip(self._ticks.slice("timestamp", lo, hi), self._ticks.slice("price", lo, hi)):
+            if ts - last_ts >= min_gap:
+                result.append(PriceTick(price=price, timestamp=ts))
+                last_ts = ts
 
         return result[-limit:]
 
-    def ohlcv(self, interval_sec: int = 60, limit: int = 100) -> list[OHLCVBar]:
-        """Aggregate ticks into OHLCV bars."""
+    def ohlcv(
+        self,
+        interval_sec: int = 60,
+        limit: int = 100,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> list[OHLCVBar]:
+        """Return OHLCV bars for any interval.
+
+        Rollup resolutions are sliced directly; multiples of a rollup (e.g. 2h,
+        1w) are merged from the coarsest rollup that divides them; anything
+        else (sub-minute, odd sizes) is aggregated from raw ticks. The window
+        follows the same rules as `history()`.
+        """
         if not self._ticks:
             return []
 
-        now = time.time()
-        cutoff = now - interval_sec * limit
-
-        bars: list[OHLCVBar] = []
-        current_bar: OHLCVBar | None = None
-        bar_end = 0.0
-
-        for tick in self._ticks:
-            if tick.timestamp < cutoff:
-                continue
-
-            if current_bar is None or tick.timestamp >= bar_end:
-                if current_bar is not None:
-                    bars.append(current_bar)
-                bar_start = tick.timestamp - (tick.timestamp % interval_sec)
-                bar_end = bar_start + interval_sec
-                current_bar = OHLCVBar(
-                    open=tick.price,
-                    high=tick.price,
-                    low=tick.price,
-                    close=tick.price,
-                    timestamp=bar_start,
-                )
-            else:
-                current_bar.high = max(current_bar.high, tick.price)
-                current_bar.low = min(current_bar.low, tick.price)
-                current_bar.close = tick.price
+        if start is None:
+            start = (time.time() if end is None else end) - interval_sec * limit
 
-        if current_bar is not None:
-            bars.append(current_bar)
+        series = self._rollups.get(interval_sec)
+        if series is not None:
+            return series.window(start, end, limit)
 
-        return bars[-limit:]
+        base = self.rollup_base(interval_sec)
+        if base is not None:
+            ratio = interval_sec // base
+            bars = self._rollups[base].window(start, end, (limit + 1) * ratio)
+            return _merge_bars(bars, interval_sec)[-limit:]
+
+        return self._aggregate_ticks(interval_sec, limit, start, end)
+
+    def rollup_base(self, interval_sec: int) -> int | None:
+        """The coarsest rollup resolution that divides `interval_sec`, if any."""
+        for base in sorted(self._rollups, reverse=True):
+            if interval_sec % base == 0:
+                return base
+        return None
+
+    def iter_rollup_chunks(
+        self, base: int, start: float, end: float | None = None, chunk_rows: int = 65_536
+    ) -> Iterator[tuple[array, ...]]:
+        """Yield (timestamps, opens, highs, lows, closes, volumes) of the `base` rollup over [start, end)."""
+        return self._rollups[base].iter_chunks(start, end, chunk_rows)
 
+    def _aggregate_ticks(
+        self, interval_sec: int, limit: int, start: float, end: float | None
+    ) -> list[OHLCVBar]:
+        """Aggregate raw ticks into OHLCV bars for non-rollup intervals.
 
-# Global singleton
-price_cache = PriceCache()
+        Only the ticks of the last `limit` bars are copied, and bars are cut
+        and reduced with NumPy, so cost doesn't grow with the tick rate.
+        """
+        lo, hi = self._tick_range(start, end)
+        if lo >= hi:
+            return []
+        last = self._ticks.get("timestamp", hi - 1)
+        first_bar = last - (last % interval_sec) - (limit - 1) * interval_sec
+        if first_bar > start:
+            lo = self._ticks.bisect_left("timestamp", first_bar)
+
+        ts = self._ticks.ndarray("timestamp", lo, hi)
+        px = self._ticks.ndarray("price", lo, hi)
+        vol = self._ticks.ndarray("volume", lo, hi)
+
+        # Bar boundaries by bisecting the (sorted) timestamps at every bucket edge
+        first = ts[0] - ts[0] % interval_sec
+        edges = first + interval_sec * np.arange(int((ts[-1] - first) // interval_sec) + 1)
+        starts = np.searchsorted(ts, edges)
+        filled = np.append(starts[1:], len(ts)) > starts  # skip buckets without ticks
+        edges, starts = edges[filled], starts[filled]
+        ends = np.append(starts[1:], len(ts))
+        cols = zip(
+            edges.tolist(),
+            px[starts].tolist(),
+            np.maximum.reduceat(px, starts).tolist(),
+            np.minimum.reduceat(px, starts).tolist(),
+            px[ends - 1].tolist(),
+            np.add.reduceat(vol, starts).tolist(),
+        )
+        bars = [OHLCVBar(open=o, high=h, low=l, close=c, volume=v, timestamp=t) for t, o, h, l, c, v in cols]
+        return bars[-limit:]
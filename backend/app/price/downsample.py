@@ -0,0 +1,32 @@
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of `n_out` points preserving the series' shape.
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    selected point and the average of the next bucket. `x` must be sorted.
+    """
+    size = x.size
+    if n_out >= size or n_out < 3:
+        return np.arange(size)
+
+    # n_out - 2 buckets spanning the interior points [1, size - 1)
+    edges = np.linspace(1, size - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = size - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < edges.size else size
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+
+    return selected
@@ -0,0 +1,167 @@
+import io
+from array import array
+from typing import AsyncIterator, Iterator
+
+from starlette.concurrency import run_in_threadpool
+
+from app.price.cache import PriceCache
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: pip install "snowball-backend[export]"
+    pa = None
+    pq = None
+
+FORMATS = {
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+TICK_FIELDS = ("timestamp", "price", "volume")
+BAR_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+CHUNK_ROWS = 65_536
+
+Columns = dict[str, array]
+
+
+def arrow_available() -> bool:
+    return pa is not None
+
+
+class _BarBuilder:
+    """Folds chronological (timestamp, open, high, low, close, volume) columns into `interval_sec` bars.
+
+    Ticks are fed as one-price bars, finer rollup bars as they are. The last
+    bar stays open until `flush`, so chunk boundaries never split a bar.
+    """
+
+    def __init__(self, interval_sec: int):
+        self.interval_sec = interval_sec
+        self._bar: list[float] | None = None  # open bar, in BAR_FIELDS order
+
+    def feed(self, ts: array, opens: array, highs: array, lows: array, closes: array, volumes: array) -> Columns:
+        """Fold one chunk; returns the bars it finished."""
+        out: Columns = {name: array("d") for name in BAR_FIELDS}
+        interval = self.interval_sec
+        bar = self._bar
+        for t, o, h, l, c, v in zip(ts, opens, highs, lows, closes, volumes):
+            bucket = t - (t % interval)
+            if bar is None or bucket > bar[0]:
+                if bar is not None:
+                    for col, value in zip(out.values(), bar):
+                        col.append(value)
+                bar = [bucket, o, h, l, c, v]
+            else:
+                if h > bar[2]:
+                    bar[2] = h
+                if l < bar[3]:
+                    bar[3] = l
+                bar[4] = c
+                bar[5] += v
+        self._bar = bar
+        return out
+
+    def flush(self) -> Columns:
+        """The open bar, if any."""
+        bar, self._bar = self._bar, None
+        if bar is None:
+            return {name: array("d") for name in BAR_FIELDS}
+        return {name: array("d", [value]) for name, value in zip(BAR_FIELDS, bar)}
+
+
+async def _bar_chunks(cache: PriceCache, interval_sec: int, start: float, end: float | None) -> AsyncIterator[Columns]:
+    """Bars for [start, end), from the coarsest rollup that divides the interval or else from raw ticks.
+
+    Source chunks are sliced on the event loop; folding them into bars runs
+    in the threadpool.
+    """
+    base = cache.rollup_base(interval_sec)
+    if base is not None:
+        source: Iterator[tuple[array, ...]] = cache.iter_rollup_chunks(base, start, end, CHUNK_ROWS)
+    else:
+        source = ((ts, p, p, p, p, v) for ts, p, v in cache.iter_tick_chunks(start, end, CHUNK_ROWS))
+
+    builder = _BarBuilder(interval_sec)
+    for cols in source:
+        bars = await run_in_threadpool(builder.feed, *cols)
+        if bars["timestamp"]:
+            yield bars
+    bars = builder.flush()
+    if bars["timestamp"]:
+        yield bars
+
+
+async def _tick_chunks(cache: PriceCache, start: float, end: float | None) -> AsyncIterator[Columns]:
+    for cols in cache.iter_tick_chunks(start, end, CHUNK_ROWS):
+        yield dict(zip(TICK_FIELDS, cols))
+
+
+def _encode_csv(cols: Columns) -> bytes:
+    rows = zip(*cols.values())
+    return "".join(",".join(map(repr, row)) + "\n" for row in rows).encode()
+
+
+class _ArrowEncoder:
+    """Incremental Arrow IPC stream / Parquet writer that hands back bytes per chunk."""
+
+    def __init__(self, fmt: str, fields: tuple[str, ...]):
+        self._sink = io.BytesIO()
+        schema = pa.schema([(name, pa.float64()) for name in fields])
+        if fmt == "arrow":
+            self._writer = pa.ipc.new_stream(self._sink, schema)
+        else:
+            self._writer = pq.ParquetWriter(self._sink, schema, compression="zstd")
+        self._schema = schema
+
+    def _drain(self) -> bytes:
+        data = self._sink.getvalue()
+        self._sink.seek(0)
+        self._sink.truncate()
+        return data
+
+    def encode(self, cols: Columns) -> bytes:
+        # pa.array reads the array('d') buffers directly
+        table = pa.Table.from_arrays([pa.array(c, type=pa.float64()) for c in cols.values()], schema=self._schema)
+        self._writer.write_table(table)
+        return self._drain()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._drain()
+
+
+async def export_stream(
+    cache: PriceCache,
+    kind: str,
+    fmt: str,
+    start: float,
+    end: float | None,
+    interval_sec: int = 60,
+) -> AsyncIterator[bytes]:
+    """Stream ticks or OHLCV bars in [start, end) as CSV, Arrow IPC or Parquet.
+
+    Chunks are sliced from the cache columns on the event loop (a C-level
+    copy of at most CHUNK_ROWS rows); bars are folded and every chunk is
+    encoded in the threadpool, so memory stays bounded by one chunk and the
+    loop is never blocked.
+    """
+    if kind == "ticks":
+        fields = TICK_FIELDS
+        chunks = _tick_chunks(cache, start, end)
+    else:
+        fields = BAR_FIELDS
+        chunks = _bar_chunks(cache, interval_sec, start, end)
+
+    if fmt == "csv":
+        yield (",".join(fields) + "\n").encode()
+        async for cols in chunks:
+            yield await run_in_threadpool(_encode_csv, cols)
+        return
+
+    encoder = _ArrowEncoder(fmt, fields)
+    async for cols in chunks:
+        data = await run_in_threadpool(encoder.encode, cols)
+        if data:
+            yield data
+    yield await run_in_threadpool(encoder.close)
@@ -0,0 +1,52 @@
+import time
+from array import array
+
+from app.price.cache import PriceCache
+
+
+class TradeIngestor:
+    """Buffers exchange trades and flushes them into a PriceCache in batches.
+
+    `submit_many` (a decoded feed batch) only appends to three float arrays;
+    aggregation happens in `flush`, once per batch.
+    """
+
+    def __init__(self, cache: PriceCache, max_pending: int = 200_000):
+        self.cache = cache
+        self.max_pending = max_pending
+        self._timestamps = array("d")
+        self._prices = array("d")
+        self._volumes = array("d")
+
+        self.received = 0
+        self.dropped = 0
+        self.last_trade_at = 0.0
+
+    def submit_many(self, timestamps: array, prices: array, quantities: array):
+        room = self.max_pending - len(self._prices)
+        if room < len(prices):
+            self.dropped += len(prices) - max(room, 0)
+            if room <= 0:
+                return
+            timestamps, prices, quantities = timestamps[:room], prices[:room], quantities[:room]
+        self._timestamps.extend(timestamps)
+        self._prices.extend(prices)
+        self._volumes.extend(quantities)
+        self.received += len(prices)
+        self.last_trade_at = time.time()
+
+    @property
+    def active(self) -> bool:
+        """True while trades are arriving (the cache is fed at full rate)."""
+        return time.time() - self.last_trade_at < 5
+
+    def flush(self) -> int:
+        """Move buffered trades into the cache. Returns the batch size."""
+        if not self._prices:
+            return 0
+
+        timestamps, prices, volumes = self._timestamps, self._prices, self._volumes
+        self._timestamps, self._prices, self._volumes = array("d"), array("d"), array("d")
+
+        self.cache.add_trades(timestamps, prices, volumes)
+        return len(prices)
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.config import settings
+from app.price.cache import PriceCache
+from app.price.ingest import TradeIngestor
+from app.price.response_cache import ResponseCache
+from app.price.tick_log import TickLog
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PriceShard:
+    """Everything held per listed symbol; shards share no state."""
+
+    symbol: str
+    cache: PriceCache
+    ingestor: TradeIngestor
+    responses: ResponseCache = field(default_factory=ResponseCache)
+
+    @property
+    def pair(self) -> str:
+        return f"{self.symbol.upper()}/USD"
+
+
+class SymbolRegistry:
+    """Symbol -> PriceShard map. Lookups are a single dict access per request."""
+
+    def __init__(self, symbols: list[str], max_ticks: int, max_bars: int):
+        self._shards: dict[str, PriceShard] = {}
+        for symbol in symbols:
+            cache = PriceCache(max_ticks, max_bars)
+            self._shards[symbol] = PriceShard(symbol, cache, TradeIngestor(cache))
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._shards)
+
+    def __iter__(self):
+        return iter(self._shards.values())
+
+    def get(self, symbol: str) -> PriceShard | None:
+        return self._shards.get(symbol.lower())
+
+    def submit_trades(self, symbol: str, timestamps: array, prices: array, quantities: array):
+        shard = self._shards.get(symbol)
+        if shard is not None:
+            shard.ingestor.submit_many(timestamps, prices, quantities)
+
+    def flush(self) -> int:
+        return sum(shard.ingestor.flush() for shard in self._shards.values())
+
+    def attach_logs(self, directory: str, segment_records: int, retention_sec: float) -> dict[str, int]:
+        """Restore each shard from its own tick log under `directory/<symbol>`."""
+        restored = {}
+        for shard in self._shards.values():
+            log = TickLog(Path(directory) / shard.symbol, segment_records, retention_sec)
+            restored[shard.symbol] = shard.cache.attach_log(log)
+        return restored
+
+    async def save_rollups(self):
+        """Snapshot every shard's rollups next to its tick log (files written off the event loop)."""
+        for shard in self._shards.values():
+            data = shard.cache.rollup_snapshot()
+            if data is not None:
+                await asyncio.to_thread(shard.cache.save_rollups, data)
+
+    def close_logs(self):
+        for shard in self._shards.values():
+            shard.cache.close_log()
+
+
+def parse_symbols(value: str) -> list[str]:
+    """'btc, ETH' -> ['btc', 'eth']; BTC is always listed (it backs the oracle)."""
+    symbols = ["btc"]
+    for symbol in value.split(","):
+        symbol = symbol.strip().lower()
+        if symbol and symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+# Global singleton
+price_registry = SymbolRegistry(
+    parse_symbols(settings.price_symbols),
+    settings.price_cache_max_ticks,
+    settings.price_rollup_max_bars,
+)
+
+
+async def trade_ingest_loop():
+    """Background task: flush buffered trades into every shard's price cache."""
+    interval = settings.trade_flush_interval_ms / 1000
+    logger.info(f"Trade ingest loop started (flush_interval={settings.trade_flush_interval_ms}ms)")
+
+    while True:
+        try:
+            price_registry.flush()
+        except Exception as e:
+            logger.error(f"Trade ingest error: {e}")
+        await asyncio.sleep(interval)
+
+
+async def rollup_snapshot_loop():
+    """Background task: periodically persist rollups, so a restart (even a crash) replays little of the tick log."""
+    interval = settings.price_rollup_snapshot_interval
+    logger.info(f"Rollup snapshot loop started (interval={interval}s)")
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await price_registry.save_rollups()
+        except Exception as e:
+            logger.error(f"Rollup snapshot error: {e}")
@@ -0,0 +1,48 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class ResponseCache:
+    """LRU of ready-to-send JSON bodies, each tagged with the data version it was built from.
+
+    A lookup with the same key and version returns the stored bytes and ETag
+    without rebuilding or re-serializing; any other version rebuilds the entry.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[Hashable, bytes, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: Hashable, build: Callable[[], Any]) -> tuple[bytes, str]:
+        """Return (body, etag) for `key`, calling `build()` only if `version` changed."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+        self.misses += 1
+        # Same encoding as FastAPI's JSONResponse
+        body = json.dumps(build(), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+        self._entries[key] = (version, body, etag)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return body, etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header value matches `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
@@ -1,15 +1,81 @@
+import re
 import time
+from dataclasses import asdict
 
-from fastapi import APIRouter, Query
+import numpy as np
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
-from app.price.cache import price_cache
+from app.config import settings
+from app.oracle.sources import decoder_name, feed_stats
+from app.price.cache import PriceTick
+from app.price.downsample import lttb
+from app.price.export import FORMATS, arrow_available, export_stream
+from app.price.registry import PriceShard, price_registry
+from app.price.response_cache import etag_matches
+from app.price.stats import compute_stats
 
 router = APIRouter(prefix="/api/price", tags=["price"])
 
+_INTERVAL_RE = re.compile(r"^(\d+)([smhdw])$")
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86_400, "w": 604_800}
+_MAX_INTERVAL = 30 * 86_400
 
-@router.get("/btc/current")
-async def get_current_price():
-    tick = price_cache.latest
+
+def _parse_interval(interval: str) -> int:
+    """'30s', '5m', '4h', '1d', '1w' -> seconds."""
+    m = _INTERVAL_RE.match(interval)
+    if m is None:
+        raise HTTPException(status_code=400, detail=f"invalid interval: {interval!r} (e.g. 1s, 30s, 5m, 4h, 1d)")
+    seconds = int(m.group(1)) * _UNIT_SECONDS[m.group(2)]
+    if not 1 <= seconds <= _MAX_INTERVAL:
+        raise HTTPException(status_code=400, detail=f"interval must be between 1s and {_MAX_INTERVAL // 86_400}d")
+    return seconds
+
+
+def _shard(symbol: str) -> PriceShard:
+    shard = price_registry.get(symbol)
+    if shard is None:
+        raise HTTPException(status_code=404, detail=f"unknown symbol: {symbol}")
+    return shard
+
+
+def _cached_json(
+    shard: PriceShard, key: tuple, interval_sec: float, end: float | None, build, if_none_match: str | None
+) -> Response:
+    """Serve a body from the shard's response cache, rebuilt only when it has new ticks."""
+    version: tuple = (shard.cache.version,)
+    if end is None:
+        # Windows ending "now" also shift when the clock crosses a bar boundary
+        version += (int(time.time() // interval_sec),)
+
+    body, etag = shard.responses.get(key, version, build)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/feed")
+async def get_feed_status():
+    """Trade feed counters (frames/batches/dropped/late) and per-symbol ingest totals."""
+    return {
+        "decoder": decoder_name(),
+        **asdict(feed_stats),
+        "ingest": {
+            shard.symbol: {
+                "received": shard.ingestor.received,
+                "dropped": shard.ingestor.dropped,
+                "last_trade_at": shard.ingestor.last_trade_at,
+            }
+            for shard in price_registry
+        },
+    }
+
+
+@router.get("/{symbol}/current")
+async def get_current_price(symbol: str):
+    tick = _shard(symbol).cache.latest
     if tick is None:
         return {"price": 0, "timestamp": 0, "stale": True}
     stale = (time.time() - tick.timestamp) > 120
@@ -20,43 +86,134 @@ async def get_current_price():
     }
 
 
-@router.get("/btc/history")
+@router.get("/{symbol}/history")
 async def get_price_history(
-    interval: str = Query("1m", description="Interval: 1m, 5m, 15m, 1h"),
+    symbol: str,
+    interval: str = Query("1m", description="Interval: <n>s|m|h|d|w, e.g. 1s, 30s, 5m, 4h, 1d"),
     limit: int = Query(100, ge=1, le=1000),
+    points: int | None = Query(None, ge=3, le=5000, description="Downsample the window to N points (LTTB) instead of interval sampling"),
+    start: float | None = Query(None, description="Range start (unix seconds, inclusive)"),
+    end: float | None = Query(None, description="Range end (unix seconds, exclusive)"),
+    if_none_match: str | None = Header(None),
 ):
-    interval_map = {"1m": 60, "5m": 300, "15m": 900, "1h": 3600}
-    interval_sec = interval_map.get(interval, 60)
+    if start is not None and end is not None and start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
 
-    ticks = price_cache.history(interval_sec, limit)
-    return {
-        "interval": interval,
-        "count": len(ticks),
-        "data": [{"price": t.price, "timestamp": t.timestamp} for t in ticks],
-    }
+    shard = _shard(symbol)
+    interval_sec = _parse_interval(interval)
+
+    def build():
+        if points is not None:
+            ticks = _downsampled_ticks(shard, interval_sec, limit, start, end, points)
+        else:
+            ticks = shard.cache.history(interval_sec, limit, start, end)
+        return {
+            "interval": interval,
+            "count": len(ticks),
+            "data": [{"price": t.price, "timestamp": t.timestamp} for t in ticks],
+        }
+
+    key = ("history", interval_sec, limit, points, start, end)
+    return _cached_json(shard, key, interval_sec, end, build, if_none_match)
 
 
-@router.get("/btc/ohlcv")
+def _downsampled_ticks(
+    shard: PriceShard,
+    interval_sec: int, limit: int, start: float | None, end: float | None, points: int
+) -> list[PriceTick]:
+    if start is None:
+        start = (time.time() if end is None else end) - interval_sec * limit
+    ts, prices, _ = shard.cache.tick_columns(start, end)
+    x = np.frombuffer(ts, dtype=np.float64)
+    y = np.frombuffer(prices, dtype=np.float64)
+    return [PriceTick(price=float(y[i]), timestamp=float(x[i])) for i in lttb(x, y, points)]
+
+
+@router.get("/{symbol}/ohlcv")
 async def get_ohlcv(
-    interval: str = Query("1m", description="Interval: 1m, 5m, 15m, 1h"),
+    symbol: str,
+    interval: str = Query("1m", description="Interval: <n>s|m|h|d|w, e.g. 1s, 30s, 5m, 4h, 1d"),
     limit: int = Query(100, ge=1, le=1000),
+    start: float | None = Query(None, description="Range start (unix seconds, inclusive)"),
+    end: float | None = Query(None, description="Range end (unix seconds, exclusive)"),
+    if_none_match: str | None = Header(None),
 ):
-    interval_map = {"1m": 60, "5m": 300, "15m": 900, "1h": 3600}
-    interval_sec = interval_map.get(interval, 60)
+    if start is not None and end is not None and start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
 
-    bars = price_cache.ohlcv(interval_sec, limit)
-    return {
-        "interval": interval,
-        "count": len(bars),
-        "data": [
-            {
-                "open": b.open,
-                "high": b.high,
-                "low": b.low,
-                "close": b.close,
-                "volume": b.volume,
-                "timestamp": b.timestamp,
-            }
-            for b in bars
-        ],
-    }
+    shard = _shard(symbol)
+    interval_sec = _parse_interval(interval)
+
+    def build():
+        bars = shard.cache.ohlcv(interval_sec, limit, start, end)
+        return {
+            "interval": interval,
+            "count": len(bars),
+            "data": [
+                {
+                    "open": b.open,
+                    "high": b.high,
+                    "low": b.low,
+                    "close": b.close,
+                    "volume": b.volume,
+                    "timestamp": b.timestamp,
+                }
+                for b in bars
+            ],
+        }
+
+    key = ("ohlcv", interval_sec, limit, start, end)
+    return _cached_json(shard, key, interval_sec, end, build, if_none_match)
+
+
+@router.get("/{symbol}/stats")
+async def get_price_stats(
+    symbol: str,
+    window: int = Query(3600, ge=60, le=7 * 86_400, description="Lookback window (seconds)"),
+    sample: float = Query(1.0, ge=0.1, le=3600, description="Return sampling step (seconds)"),
+    rolling: int | None = Query(None, ge=1, description="Rolling min/max window (seconds), default: round duration"),
+    if_none_match: str | None = Header(None),
+):
+    """VWAP, realized volatility, log-return distribution and rolling range."""
+    if window / sample > 200_000:
+        raise HTTPException(status_code=400, detail="window/sample exceeds 200000 samples")
+    shard = _shard(symbol)
+    rolling_sec = rolling or settings.round_duration
+
+    def build():
+        end = time.time()
+        start = end - window
+        ts, prices, volumes = shard.cache.tick_columns(start)
+        return {
+            "window": window,
+            "sample": sample,
+            **compute_stats(ts, prices, volumes, start, end, sample, rolling_sec),
+        }
+
+    key = ("stats", window, sample, rolling_sec)
+    return _cached_json(shard, key, sample, None, build, if_none_match)
+
+
+@router.get("/{symbol}/export")
+async def export_history(
+    symbol: str,
+    kind: str = Query("ticks", pattern="^(ticks|bars)$", description="ticks | bars"),
+    format: str = Query("csv", pattern="^(csv|arrow|parquet)$", description="csv | arrow | parquet"),
+    start: float = Query(..., description="Range start (unix seconds, inclusive)"),
+    end: float | None = Query(None, description="Range end (unix seconds, exclusive)"),
+    interval: str = Query("1m", description="Bar interval when kind=bars"),
+):
+    """Stream tick or OHLCV history for a time range (no row limit)."""
+    if end is not None and start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    if format != "csv" and not arrow_available():
+        raise HTTPException(status_code=501, detail=f"{format} export requires pyarrow")
+    shard = _shard(symbol)
+    interval_sec = _parse_interval(interval)
+
+    filename = f"{shard.symbol}-{kind}-{int(start)}-{int(end or time.time())}.{format}"
+    return StreamingResponse(
+        export_stream(shard.cache, kind, format, start, end, interval_sec),
+        media_type=FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
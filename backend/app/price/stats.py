@@ -0,0 +1,87 @@
+from array import array
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+SECONDS_PER_YEAR = 365 * 86_400
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+
+def _finite(x: float) -> float | None:
+    return None if not np.isfinite(x) else float(x)
+
+
+def compute_stats(
+    timestamps: array,
+    prices: array,
+    volumes: array,
+    start: float,
+    end: float,
+    sample_sec: float = 1.0,
+    rolling_sec: float = 300.0,
+) -> dict:
+    """Price analytics over tick columns in [start, end).
+
+    Returns are taken on a fixed `sample_sec` grid (last trade at or before
+    each grid point) so trade bursts don't bias volatility. `rolling` reports
+    min/max over the trailing `rolling_sec` and the mean high-low range of all
+    `rolling_sec` windows, i.e. the typical move over one round.
+    """
+    # Zero-copy views over the array('d') columns
+    ts = np.frombuffer(timestamps, dtype=np.float64)
+    px = np.frombuffer(prices, dtype=np.float64)
+    vol = np.frombuffer(volumes, dtype=np.float64)
+
+    result: dict = {"count": int(px.size)}
+    if px.size == 0:
+        return result
+
+    total_volume = float(vol.sum())
+    result.update(
+        open=float(px[0]),
+        last=float(px[-1]),
+        high=float(px.max()),
+        low=float(px.min()),
+        volume=total_volume,
+        # Without traded volume (sampled sources) fall back to the mean price
+        vwap=float(np.dot(px, vol) / total_volume) if total_volume > 0 else float(px.mean()),
+    )
+
+    grid = np.arange(max(start, ts[0]) + sample_sec, end + sample_sec / 2, sample_sec)
+    idx = np.searchsorted(ts, grid, side="right") - 1
+    sampled = px[idx[idx >= 0]]
+    if sampled.size < 2:
+        return result
+
+    returns = np.diff(np.log(sampled))
+    std = returns.std(ddof=1) if returns.size > 1 else 0.0
+    mean = returns.mean()
+    centered = returns - mean
+    m2 = np.mean(centered**2)
+
+    result["volatility"] = {
+        "realized": float(np.sqrt(np.sum(returns**2))),
+        "annualized": float(std * np.sqrt(SECONDS_PER_YEAR / sample_sec)),
+    }
+    result["returns"] = {
+        "samples": int(returns.size),
+        "mean": float(mean),
+        "std": float(std),
+        "skew": _finite(np.mean(centered**3) / m2**1.5) if m2 > 0 else 0.0,
+        "kurtosis": _finite(np.mean(centered**4) / m2**2 - 3) if m2 > 0 else 0.0,
+        "percentiles": {
+            f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(returns, PERCENTILES))
+        },
+    }
+
+    span = max(1, min(sampled.size, int(round(rolling_sec / sample_sec)) + 1))
+    windows = sliding_window_view(sampled, span)
+    highs = windows.max(axis=1)
+    lows = windows.min(axis=1)
+    result["rolling"] = {
+        "window": rolling_sec,
+        "min": float(lows[-1]),
+        "max": float(highs[-1]),
+        "range_mean": float(np.mean(highs - lows)),
+    }
+    return result
@@ -0,0 +1,212 @@
+import logging
+import mmap
+import os
+import struct
+import time
+from array import array
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+# Segment layout: 16-byte header followed by fixed-size little-endian records.
+# The header's record count is bumped after each record is written, so a
+# crash can at worst lose the record being written.
+MAGIC = b"SBTK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ")  # magic, version, record size, record count
+RECORD = struct.Struct("<ddd")  # timestamp, price, volume
+
+SNAPSHOT_NAME = "rollups.bin"  # PriceCache rollups, so a restart needn't replay the whole log
+
+TickColumns = tuple[array, array, array]  # timestamps, prices, volumes
+
+
+class TickLog:
+    """Append-only, memory-mapped tick log split into fixed-size segments.
+
+    Each segment file is preallocated to `segment_records` records and named
+    after its first tick (`ticks-<unix_ms>.seg`), so lexical order is time
+    order. Full segments are rotated; segments whose newest tick is older than
+    `retention_sec` are deleted on open and on rotation. A rollup snapshot
+    may be stored alongside (`save_snapshot`).
+    """
+
+    def __init__(self, directory: str | Path, segment_records: int = 1_048_576, retention_sec: float = 14 * 86_400):
+        if segment_records <= 0:
+            raise ValueError("segment_records must be positive")
+        self.directory = Path(directory)
+        self.segment_records = segment_records
+        self.retention_sec = retention_sec
+
+        self._file = None
+        self._mm: mmap.mmap | None = None
+        self._count = 0
+        self._capacity = 0  # records the active segment can hold
+
+    # ─── Reading ───
+
+    def _segments(self) -> list[Path]:
+        return sorted(self.directory.glob("ticks-*.seg"))
+
+    @staticmethod
+    def _read_count(mm: mmap.mmap, path: Path) -> int:
+        magic, version, record_size, count = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            raise ValueError(f"Unrecognized tick log segment: {path}")
+        return min(count, (len(mm) - HEADER.size) // RECORD.size)
+
+    @staticmethod
+    def _first_ts(path: Path) -> float:
+        return int(path.stem.split("-", 1)[1]) / 1000
+
+    def _header_count(self, path: Path) -> int:
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._read_count(mm, path)
+        except (ValueError, struct.error):
+            return 0  # reported when read
+
+    def read(self, since: float | None = None, max_records: int | None = None) -> Iterator[TickColumns]:
+        """Yield (timestamps, prices, volumes) columns per retained segment, oldest first.
+
+        With `max_records` and/or `since`, only the newest segments are read:
+        those holding the last `max_records` records plus any that may hold
+        records after `since`. Records are copied out of the mapping in one
+        block and de-interleaved with strided array slices, so no per-record
+        parsing happens in Python.
+        """
+        segments = self._segments()
+        if max_records is not None or since is not None:
+            first = len(segments)
+            if max_records is not None:
+                held = 0
+                while first > 0 and held < max_records:
+                    first -= 1
+                    held += self._header_count(segments[first])
+            if since is not None:
+                # A segment holds records from its name's timestamp until the next one starts
+                for i in range(first):
+                    if i + 1 == len(segments) or self._first_ts(segments[i + 1]) > since:
+                        first = i
+                        break
+            segments = segments[first:]
+
+        for path in segments:
+            try:
+                with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    count = self._read_count(mm, path)
+                    raw = array("d")
+                    raw.frombytes(mm[HEADER.size:HEADER.size + count * RECORD.size])
+            except (ValueError, struct.error) as e:
+                logger.warning(f"Skipping tick log segment {path.name}: {e}")
+                continue
+            if raw:
+                yield raw[0::3], raw[1::3], raw[2::3]
+
+    def load_snapshot(self) -> bytes | None:
+        """The rollup snapshot kept next to the segments, if any."""
+        path = self.directory / SNAPSHOT_NAME
+        return path.read_bytes() if path.exists() else None
+
+    def save_snapshot(self, data: bytes):
+        """Atomically replace the rollup snapshot."""
+        tmp = self.directory / f"{SNAPSHOT_NAME}.tmp"
+        tmp.write_bytes(data)
+        os.replace(tmp, self.directory / SNAPSHOT_NAME)
+
+    # ─── Writing ───
+
+    def open(self):
+        """Prune expired segments and map the newest one for appending."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._prune()
+
+        segments = self._segments()
+        if segments:
+            try:
+                self._map(segments[-1])
+            except (ValueError, struct.error) as e:
+                # Leave the damaged segment for inspection; the next append rotates
+                logger.warning(f"Cannot append to tick log segment {segments[-1].name}: {e}")
+                self._unmap()
+
+    def append(self, ts: float, price: float, volume: float):
+        if self._mm is None or self._count >= self._capacity:
+            self._rotate(ts)
+
+        RECORD.pack_into(self._mm, HEADER.size + self._count * RECORD.size, ts, price, volume)
+        self._count += 1
+        HEADER.pack_into(self._mm, 0, MAGIC, VERSION, RECORD.size, self._count)
+
+    def extend(self, timestamps: array, prices: array, volumes: array):
+        """Append a batch of records, interleaved in one array and copied per segment."""
+        n = len(timestamps)
+        raw = array("d", bytes(8 * 3 * n))
+        raw[0::3], raw[1::3], raw[2::3] = timestamps, prices, volumes
+
+        pos = 0
+        while pos < n:
+            if self._mm is None or self._count >= self._capacity:
+                self._rotate(timestamps[pos])
+            run = min(n - pos, self._capacity - self._count)
+            offset = HEADER.size + self._count * RECORD.size
+            self._mm[offset:offset + run * RECORD.size] = raw[pos * 3:(pos + run) * 3].tobytes()
+            self._count += run
+            HEADER.pack_into(self._mm, 0, MAGIC, VERSION, RECORD.size, self._count)
+            pos += run
+
+    def flush(self):
+        if self._mm is not None:
+            self._mm.flush()
+
+    def close(self):
+        self.flush()
+        self._unmap()
+
+    def _map(self, path: Path):
+        self._file = open(path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._count = self._read_count(self._mm, path)
+        self._capacity = (len(self._mm) - HEADER.size) // RECORD.size
+
+    def _unmap(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._count = 0
+        self._capacity = 0
+
+    def _rotate(self, ts: float):
+        self.close()
+        ts_ms = int(ts * 1000)
+        while (self.directory / f"ticks-{ts_ms:013d}.seg").exists():
+            ts_ms += 1
+        path = self.directory / f"ticks-{ts_ms:013d}.seg"
+        with open(path, "wb") as f:
+            f.truncate(HEADER.size + self.segment_records * RECORD.size)
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0))
+        self._map(path)
+        logger.info(f"Tick log rotated to {path.name}")
+        self._prune()
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_sec
+        active = Path(self._file.name) if self._file is not None else None
+
+        for path in self._segments():
+            if path == active:
+                continue
+            try:
+                with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    count = self._read_count(mm, path)
+                    last_ts = RECORD.unpack_from(mm, HEADER.size + (count - 1) * RECORD.size)[0] if count else 0.0
+            except (ValueError, struct.error) as e:
+                logger.warning(f"Skipping tick log segment {path.name}: {e}")
+                continue
+            if last_ts < cutoff:
+                os.remove(path)
+                logger.info(f"Tick log segment expired: {path.name}")
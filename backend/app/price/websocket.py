@@ -1,23 +1,29 @@
 import asyncio
 import json
 import logging
-import time
 
 from fastapi import WebSocket, WebSocketDisconnect
 
-from app.oracle.sources import get_latest_price
-from app.price.cache import price_cache
+from app.config import settings
+from app.price.bus import PriceUpdate, price_bus
+from app.price.registry import price_registry
 
 logger = logging.getLogger(__name__)
 
-# Connected WS clients
-_clients: set[WebSocket] = set()
+# Connected WS clients -> subscribed symbols
+_clients: dict[WebSocket, frozenset[str]] = {}
 
 
 async def price_ws_handler(ws: WebSocket):
-    """WebSocket endpoint: broadcast real-time BTC price."""
+    """WebSocket endpoint: broadcast real-time prices.
+
+    Clients get BTC by default; `?symbols=btc,eth` subscribes to more.
+    """
+    requested = ws.query_params.get("symbols", "btc")
+    symbols = frozenset(s.strip().lower() for s in requested.split(",") if price_registry.get(s.strip()))
+
     await ws.accept()
-    _clients.add(ws)
+    _clients[ws] = symbols
     logger.info(f"WS client connected ({len(_clients)} total)")
 
     try:
@@ -27,39 +33,59 @@ async def price_ws_handler(ws: WebSocket):
     except WebSocketDisconnect:
         pass
     finally:
-        _clients.discard(ws)
+        _clients.pop(ws, None)
         logger.info(f"WS client disconnected ({len(_clients)} total)")
 
 
-async def price_broadcast_loop():
-    """Background task: broadcast price to all WS clients every second."""
-    last_price = 0.0
+async def _broadcast(update: PriceUpdate):
+    shard = price_registry.get(update.symbol)
+    if shard is None:
+        return
+    # Sampled ticks only when no trade feed is filling the cache
+    if not shard.ingestor.active:
+        shard.cache.add_tick(update.price)
+
+    message = json.dumps({
+        "type": "price",
+        "symbol": shard.pair,
+        "price": update.price,
+        "timestamp": update.timestamp,
+    })
 
-    while True:
+    dead: list[WebSocket] = []
+    for client, symbols in _clients.items():
+        if shard.symbol not in symbols:
+            continue
         try:
-            price = get_latest_price()
-            if price > 0 and price != last_price:
-                last_price = price
-                price_cache.add_tick(price)
-
-                message = json.dumps({
-                    "type": "price",
-                    "symbol": "BTC/USD",
-                    "price": price,
-                    "timestamp": time.time(),
-                })
-
-                dead: list[WebSocket] = []
-                for client in _clients:
-                    try:
-                        await client.send_text(message)
-                    except Exception:
-                        dead.append(client)
-
-                for client in dead:
-                    _clients.discard(client)
-
-        except Exception as e:
-            logger.error(f"Broadcast error: {e}")
-
-        await asyncio.sleep(1)
+            await client.send_text(message)
+        except Exception:
+            dead.append(client)
+
+    for client in dead:
+        _clients.pop(client, None)
+
+
+async def price_broadcast_loop():
+    """Background task: push new prices to WS clients as they arrive on the price bus.
+
+    Bursts are conflated to the newest price per symbol, at most once per
+    `price_ws_min_interval_ms`.
+    """
+    sub = price_bus.subscribe(maxsize=64)
+    min_interval = settings.price_ws_min_interval_ms / 1000
+
+    try:
+        while True:
+            first = await sub.get()
+            updates = sub.drain()
+            updates.setdefault(first.symbol, first)
+
+            for update in updates.values():
+                try:
+                    await _broadcast(update)
+                except Exception as e:
+                    logger.error(f"Broadcast error ({update.symbol}): {e}")
+
+            await asyncio.sleep(min_interval)
+    finally:
+        sub.close()
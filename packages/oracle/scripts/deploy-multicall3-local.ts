@@ -0,0 +1,57 @@
+/**
+ * Snowball Oracle -- deploy Multicall3 to a local anvil node
+ *
+ * Public chains already have Multicall3 at its canonical address; a fresh
+ * anvil does not. This deploys src/Multicall3.sol and prints the address to
+ * put in the backend's MULTICALL3_ADDRESS.
+ *
+ * Usage (with anvil running): make deploy-multicall3-local
+ *   LOCAL_RPC_URL        default http://127.0.0.1:8545
+ *   DEPLOYER_PRIVATE_KEY default: anvil account #0
+ */
+import { createPublicClient, createWalletClient, http, type Abi } from "viem";
+import { privateKeyToAccount } from "viem/accounts";
+import { foundry } from "viem/chains";
+import * as fs from "fs";
+import * as path from "path";
+
+const CANONICAL_MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11";
+// anvil's well-known dev account #0 (never use outside a local node)
+const ANVIL_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80";
+
+const RPC_URL = process.env.LOCAL_RPC_URL || "http://127.0.0.1:8545";
+const account = privateKeyToAccount((process.env.DEPLOYER_PRIVATE_KEY || ANVIL_KEY) as `0x${string}`);
+const publicClient = createPublicClient({ chain: foundry, transport: http(RPC_URL) });
+const walletClient = createWalletClient({ account, chain: foundry, transport: http(RPC_URL) });
+
+function loadArtifact(contractName: string): { abi: Abi; bytecode: `0x${string}` } {
+  const p = path.join(__dirname, `../out/${contractName}.sol/${contractName}.json`);
+  if (fs.existsSync(p)) {
+    const artifact = JSON.parse(fs.readFileSync(p, "utf8"));
+    const bytecode = artifact.bytecode?.object ?? artifact.bytecode;
+    return { abi: artifact.abi, bytecode: bytecode as `0x${string}` };
+  }
+  throw new Error(`Foundry artifact not found: ${contractName} (run 'forge build' first)`);
+}
+
+async function main() {
+  const existing = await publicClient.getCode({ address: CANONICAL_MULTICALL3 });
+  if (existing && existing !== "0x") {
+    console.log(`Multicall3 already deployed at ${CANONICAL_MULTICALL3}`);
+    console.log(`MULTICALL3_ADDRESS=${CANONICAL_MULTICALL3}`);
+    return;
+  }
+
+  const { abi, bytecode } = loadArtifact("Multicall3");
+  const hash = await walletClient.deployContract({ abi, bytecode, args: [] });
+  const receipt = await publicClient.waitForTransactionReceipt({ hash });
+  if (receipt.status !== "success") throw new Error("Deploy Multicall3 failed");
+
+  console.log(`Multicall3 deployed to ${RPC_URL}`);
+  console.log(`MULTICALL3_ADDRESS=${receipt.contractAddress}`);
+}
+
+main().then(() => process.exit(0)).catch((err) => {
+  console.error("\nDeployment failed:", err.message || err);
+  process.exit(1);
+});
@@ -0,0 +1,97 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+/// @title Multicall3
+/// @notice Batches view calls into one eth_call, evaluated at a single block
+/// @dev ABI-compatible subset of Multicall3 (https://www.multicall3.com, canonically at
+///      0xcA11bde05977b3631167028862bE2a173976CA11). Deploy it where the canonical
+///      contract is missing, e.g. a local anvil node.
+contract Multicall3 {
+    struct Call {
+        address target;
+        bytes callData;
+    }
+
+    struct Call3 {
+        address target;
+        bool allowFailure;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    /// @notice Call every target; reverts if any call fails
+    function aggregate(Call[] calldata calls) public payable returns (uint256 blockNumber, bytes[] memory returnData) {
+        blockNumber = block.number;
+        returnData = new bytes[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            (bool success, bytes memory ret) = calls[i].target.call(calls[i].callData);
+            require(success, "Multicall3: call failed");
+            returnData[i] = ret;
+        }
+    }
+
+    /// @notice Call every target; failures are reported per call unless `requireSuccess`
+    function tryAggregate(bool requireSuccess, Call[] calldata calls) public payable returns (Result[] memory returnData) {
+        returnData = new Result[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            (bool success, bytes memory ret) = calls[i].target.call(calls[i].callData);
+            if (requireSuccess) require(success, "Multicall3: call failed");
+            returnData[i] = Result(success, ret);
+        }
+    }
+
+    /// @notice `tryAggregate` plus the block the calls were evaluated at
+    function tryBlockAndAggregate(bool requireSuccess, Call[] calldata calls)
+        public
+        payable
+        returns (uint256 blockNumber, bytes32 blockHash, Result[] memory returnData)
+    {
+        blockNumber = block.number;
+        blockHash = blockhash(block.number);
+        returnData = tryAggregate(requireSuccess, calls);
+    }
+
+    /// @notice `tryBlockAndAggregate` that reverts if any call fails
+    function blockAndAggregate(Call[] calldata calls)
+        public
+        payable
+        returns (uint256 blockNumber, bytes32 blockHash, Result[] memory returnData)
+    {
+        (blockNumber, blockHash, returnData) = tryBlockAndAggregate(true, calls);
+    }
+
+    /// @notice Call every target; each call chooses whether its failure reverts the batch
+    function aggregate3(Call3[] calldata calls) public payable returns (Result[] memory returnData) {
+        returnData = new Result[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            Call3 calldata c = calls[i];
+            (bool success, bytes memory ret) = c.target.call(c.callData);
+            require(success || c.allowFailure, "Multicall3: call failed");
+            returnData[i] = Result(success, ret);
+        }
+    }
+
+    function getBlockNumber() public view returns (uint256 blockNumber) {
+        blockNumber = block.number;
+    }
+
+    function getCurrentBlockTimestamp() public view returns (uint256 timestamp) {
+        timestamp = block.timestamp;
+    }
+
+    function getBasefee() public view returns (uint256 basefee) {
+        basefee = block.basefee;
+    }
+
+    function getChainId() public view returns (uint256 chainid) {
+        chainid = block.chainid;
+    }
+
+    function getEthBalance(address addr) public view returns (uint256 balance) {
+        balance = addr.balance;
+    }
+}
@@ -0,0 +1,96 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.24;
+
+import {Test} from "forge-std/Test.sol";
+import {Multicall3} from "../src/Multicall3.sol";
+import {BTCMockOracle} from "../src/BTCMockOracle.sol";
+
+contract Multicall3Test is Test {
+    Multicall3 multicall;
+    BTCMockOracle oracle;
+    address admin = address(1);
+
+    uint256 constant BTC_PRICE = 95_000 * 1e18;
+
+    function setUp() public {
+        multicall = new Multicall3();
+        vm.prank(admin);
+        oracle = new BTCMockOracle(admin);
+        vm.prank(admin);
+        oracle.updatePrice(BTC_PRICE);
+    }
+
+    function _calls() internal view returns (Multicall3.Call[] memory calls) {
+        calls = new Multicall3.Call[](2);
+        calls[0] = Multicall3.Call(address(oracle), abi.encodeCall(oracle.price, ()));
+        calls[1] = Multicall3.Call(address(oracle), abi.encodeCall(oracle.lastUpdated, ()));
+    }
+
+    // ─── aggregate ───
+
+    function test_aggregate_returnsAllResults() public {
+        (uint256 blockNumber, bytes[] memory ret) = multicall.aggregate(_calls());
+        assertEq(blockNumber, block.number);
+        assertEq(abi.decode(ret[0], (uint256)), BTC_PRICE);
+        assertEq(abi.decode(ret[1], (uint256)), block.timestamp);
+    }
+
+    function test_aggregate_revertOnFailure() public {
+        Multicall3.Call[] memory calls = new Multicall3.Call[](1);
+        calls[0] = Multicall3.Call(address(oracle), abi.encodeCall(oracle.updatePrice, (1)));
+        vm.expectRevert("Multicall3: call failed");
+        multicall.aggregate(calls);
+    }
+
+    // ─── tryBlockAndAggregate ───
+
+    function test_tryBlockAndAggregate_isolatesFailures() public {
+        vm.roll(100);
+        Multicall3.Call[] memory calls = new Multicall3.Call[](2);
+        calls[0] = Multicall3.Call(address(oracle), abi.encodeCall(oracle.updatePrice, (1))); // not an operator
+        calls[1] = Multicall3.Call(address(oracle), abi.encodeCall(oracle.price, ()));
+
+        (uint256 blockNumber,, Multicall3.Result[] memory ret) = multicall.tryBlockAndAggregate(false, calls);
+        assertEq(blockNumber, 100);
+        assertFalse(ret[0].success);
+        assertTrue(ret[1].success);
+        assertEq(abi.decode(ret[1].returnData, (uint256)), BTC_PRICE);
+    }
+
+    function test_tryBlockAndAggregate_requireSuccess() public {
+        Multicall3.Call[] memory calls = new Multicall3.Call[](1);
+        calls[0] = Multicall3.Call(address(oracle), abi.encodeCall(oracle.updatePrice, (1)));
+        vm.expectRevert("Multicall3: call failed");
+        multicall.tryBlockAndAggregate(true, calls);
+    }
+
+    // ─── aggregate3 ───
+
+    function test_aggregate3_allowFailure() public {
+        Multicall3.Call3[] memory calls = new Multicall3.Call3[](2);
+        calls[0] = Multicall3.Call3(address(oracle), true, abi.encodeCall(oracle.updatePrice, (1)));
+        calls[1] = Multicall3.Call3(address(oracle), false, abi.encodeCall(oracle.price, ()));
+
+        Multicall3.Result[] memory ret = multicall.aggregate3(calls);
+        assertFalse(ret[0].success);
+        assertEq(abi.decode(ret[1].returnData, (uint256)), BTC_PRICE);
+    }
+
+    function test_aggregate3_revertWhenFailureNotAllowed() public {
+        Multicall3.Call3[] memory calls = new Multicall3.Call3[](1);
+        calls[0] = Multicall3.Call3(address(oracle), false, abi.encodeCall(oracle.updatePrice, (1)));
+        vm.expectRevert("Multicall3: call failed");
+        multicall.aggregate3(calls);
+    }
+
+    // ─── block helpers ───
+
+    function test_blockHelpers() public {
+        vm.roll(42);
+        vm.warp(1_700_000_000);
+        assertEq(multicall.getBlockNumber(), 42);
+        assertEq(multicall.getCurrentBlockTimestamp(), 1_700_000_000);
+        assertEq(multicall.getChainId(), block.chainid);
+        assertEq(multicall.getEthBalance(admin), admin.balance);
+    }
+}
@@ -33,6 +33,7 @@ echo "Extracting ABIs..."
 
 # Oracle
 extract "oracle" "BTCMockOracle"
+extract "oracle" "Multicall3"
 
 # Options
 extract "options" "OptionsClearingHouse"
@@ -48,5 +49,14 @@ extract "yield" "StrategySbUSDMorpho"
 extract "yield" "StrategyWCTCMorpho"
 extract "yield" "StrategyUSDCMorpho"
 
+# Compact single-file bundle loaded once by the backend ({"<package>/<Contract>": abi})
+python3 -c "
+import json, pathlib
+abi_dir = pathlib.Path('$ABI_DIR')
+bundle = {f'{p.parent.name}/{p.stem}': json.loads(p.read_text())['abi'] for p in sorted(abi_dir.glob('*/*.json'))}
+(abi_dir / 'bundle.json').write_text(json.dumps(bundle, separators=(',', ':')))
+print(f'  ✓ bundle.json ({len(bundle)} contracts)')
+" 2>/dev/null || jq -c -n 'reduce inputs as $a ({}; . + {(input_filename | split("/") | .[-2:] | join("/") | rtrimstr(".json")): $a.abi})' "$ABI_DIR"/*/*.json > "$ABI_DIR/bundle.json"
+
 echo ""
 echo "ABIs extracted to: $ABI_DIR"